@@ -7,12 +7,36 @@ This script helps diagnose issues with joystick detection and configuration.
 import os
 import sys
 import time
+from collections import namedtuple
 import pygame
 
+# Optional Joystick methods differ between pygame versions; probe the class once at import
+# (in pygame 2, Joystick is a factory function and JoystickType is the class)
+_JOYSTICK_CLASS = getattr(pygame.joystick, "JoystickType", pygame.joystick.Joystick)
+_HAS_GUID = hasattr(_JOYSTICK_CLASS, 'get_guid')
+_HAS_INSTANCE_ID = hasattr(_JOYSTICK_CLASS, 'get_instance_id')
+_HAS_NUMBALLS = hasattr(_JOYSTICK_CLASS, 'get_numballs')
+
+# Minimum time between status line redraws while monitoring (~60 Hz)
+REDRAW_INTERVAL = 1 / 60
+
+# Joystick capabilities never change once a joystick is opened, so query them once
+JoyCaps = namedtuple("JoyCaps", ["num_axes", "num_buttons", "num_hats"])
+
+def get_joystick_caps(joystick):
+    """Query the capabilities of an initialized joystick once."""
+    return JoyCaps(joystick.get_numaxes(), joystick.get_numbuttons(), joystick.get_numhats())
+
 def initialize_pygame():
-    """Initialize pygame with error handling."""
+    """Initialize only the pygame subsystems the check utility needs, with error handling."""
     try:
-        pygame.init()
+        try:
+            # pygame's event queue requires the video subsystem, but no window or audio/font setup
+            pygame.display.init()
+            pygame.joystick.init()
+        except pygame.error as e:
+            print(f"Partial pygame initialization failed ({e}), falling back to full initialization")
+            pygame.init()
         print(f"pygame initialized successfully. Version: {pygame.version.ver}")
         
         # Check SDL version
@@ -43,18 +67,17 @@ def check_joysticks():
                 joystick.init()
                 
                 name = joystick.get_name()
-                guid = joystick.get_guid() if hasattr(joystick, 'get_guid') else "N/A"
-                instance_id = joystick.get_instance_id() if hasattr(joystick, 'get_instance_id') else "N/A"
+                guid = joystick.get_guid() if _HAS_GUID else "N/A"
+                instance_id = joystick.get_instance_id() if _HAS_INSTANCE_ID else "N/A"
                 
                 print(f"\nJoystick {i}: {name}")
                 print(f"  GUID: {guid}")
                 print(f"  Instance ID: {instance_id}")
                 
                 # Get joystick capabilities
-                num_axes = joystick.get_numaxes()
-                num_buttons = joystick.get_numbuttons()
-                num_hats = joystick.get_numhats()
-                num_balls = joystick.get_numballs() if hasattr(joystick, 'get_numballs') else 0
+                caps = get_joystick_caps(joystick)
+                num_axes, num_buttons, num_hats = caps
+                num_balls = joystick.get_numballs() if _HAS_NUMBALLS else 0
                 
                 print(f"  Axes: {num_axes}")
                 print(f"  Buttons: {num_buttons}")
@@ -64,9 +87,10 @@ def check_joysticks():
                 # Check axis values
                 if num_axes > 0:
                     print("\n  Current axis values:")
+                    axis_getter = joystick.get_axis
                     for axis in range(num_axes):
                         try:
-                            value = joystick.get_axis(axis)
+                            value = axis_getter(axis)
                             print(f"    Axis {axis}: {value:.6f}")
                         except pygame.error as e:
                             print(f"    Error reading axis {axis}: {e}")
@@ -74,9 +98,10 @@ def check_joysticks():
                 # Check button values
                 if num_buttons > 0:
                     print("\n  Current button states:")
+                    button_getter = joystick.get_button
                     for button in range(num_buttons):
                         try:
-                            value = joystick.get_button(button)
+                            value = button_getter(button)
                             print(f"    Button {button}: {value}")
                         except pygame.error as e:
                             print(f"    Error reading button {button}: {e}")
@@ -84,9 +109,10 @@ def check_joysticks():
                 # Check hat values
                 if num_hats > 0:
                     print("\n  Current hat states:")
+                    hat_getter = joystick.get_hat
                     for hat in range(num_hats):
                         try:
-                            value = joystick.get_hat(hat)
+                            value = hat_getter(hat)
                             print(f"    Hat {hat}: {value}")
                         except pygame.error as e:
                             print(f"    Error reading hat {hat}: {e}")
@@ -100,6 +126,9 @@ def check_joysticks():
                         print("  WARNING: This Chakram X joystick has fewer than 2 axes, which may cause issues.")
                     else:
                         print("  This Chakram X joystick has the required number of axes.")
+                else:
+                    # Close joysticks we will never monitor so SDL stops polling them
+                    joystick.quit()
                 
             except pygame.error as e:
                 print(f"Error initializing joystick {i}: {e}")
@@ -116,6 +145,11 @@ def monitor_joystick_movement(joystick_id=0, duration=10):
             print(f"Joystick {joystick_id} not found.")
             return False
         
+        # Release every other joystick so each pump only updates the monitored device
+        for other_id in range(pygame.joystick.get_count()):
+            if other_id != joystick_id:
+                pygame.joystick.Joystick(other_id).quit()
+        
         joystick = pygame.joystick.Joystick(joystick_id)
         joystick.init()
         
@@ -126,23 +160,52 @@ def monitor_joystick_movement(joystick_id=0, duration=10):
         start_time = time.time()
         end_time = start_time + duration
         
+        # Seed the latest axis values once; afterwards they are only updated from events
+        caps = get_joystick_caps(joystick)
+        axis_getter = joystick.get_axis
+        axis_state = {axis: axis_getter(axis) for axis in range(caps.num_axes)}
+        # Joystick events carry the instance ID where pygame has one, otherwise the device index
+        if _HAS_INSTANCE_ID:
+            event_id_attr, joystick_event_id = "instance_id", joystick.get_instance_id()
+        else:
+            event_id_attr, joystick_event_id = "joy", joystick_id
+        
+        axes_changed = True
+        last_redraw = 0.0
+        
+        # Write status redraws straight to the byte stream, after flushing pending text output
+        sys.stdout.flush()
+        stdout_buffer = sys.stdout.buffer
+        
         try:
             while time.time() < end_time:
-                # Process events to get fresh joystick data
-                pygame.event.pump()
+                # Block until the next event (or 16 ms) instead of sleeping blindly,
+                # then drain whatever else is already queued in a single call
+                first_event = pygame.event.wait(16)
+                for event in [first_event] + pygame.event.get(pump=False):
+                    if event.type == pygame.JOYAXISMOTION and getattr(event, event_id_attr) == joystick_event_id:
+                        # Keep only the most recent value per axis
+                        axis_state[event.axis] = event.value
+                        axes_changed = True
+                
+                # Nothing new arrived within the wait budget
+                if not axes_changed:
+                    continue
                 
-                # Get axis values
-                axes_values = []
-                for axis in range(joystick.get_numaxes()):
-                    value = joystick.get_axis(axis)
-                    axes_values.append(f"Axis {axis}: {value:+.2f}")
+                # Cap redraws at ~60 Hz; a skipped change is drawn on a later pass
+                now = time.time()
+                if now - last_redraw < REDRAW_INTERVAL:
+                    continue
+                last_redraw = now
+                axes_changed = False
                 
-                # Clear line and print current values
-                sys.stdout.write("\r" + " " * 80)  # Clear line
-                sys.stdout.write("\r" + " | ".join(axes_values[:4]))  # Show first 4 axes
-                sys.stdout.flush()
+                # Format axis values
+                axes_values = [f"Axis {axis}: {value:+.2f}" for axis, value in sorted(axis_state.items())]
                 
-                time.sleep(0.1)
+                # Overwrite the status line in a single write; padding clears the previous text
+                status_line = "\r" + " | ".join(axes_values[:4]).ljust(80)  # Show first 4 axes
+                stdout_buffer.write(status_line.encode("ascii"))
+                stdout_buffer.flush()
             
             print("\nMonitoring complete.")
             return True
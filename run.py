@@ -6,7 +6,6 @@ Launcher script for the Chakram X Alternative Control System for Mortal Online 2
 import os
 import sys
 import subprocess
-import importlib.util
 
 # Set environment variable for background joystick events
 os.environ["SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS"] = "1"
@@ -21,6 +20,7 @@ def main():
     parser.add_argument("--joystick", type=int, help="Specific joystick ID to use")
     parser.add_argument("--config", action="store_true", help="Launch the configuration editor")
     parser.add_argument("--check", action="store_true", help="Run joystick check utility")
+    parser.add_argument("--quiet", action="store_true", help="Don't print key actions and status messages")
     args = parser.parse_args()
     
     # Check if we should launch the config editor
@@ -37,13 +37,11 @@ def main():
     # Check if we should run the joystick check utility
     elif args.check:
         try:
-            # Import and run the check.py module
-            spec = importlib.util.spec_from_file_location("check", "check.py")
-            check_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(check_module)
+            # Import and run the check.py module (a sibling of this launcher)
+            import check
             
             print("Running Chakram X joystick check utility...")
-            return check_module.main()
+            return check.main()
         except Exception as e:
             print(f"Error running joystick check utility: {e}")
             return 1
@@ -63,6 +61,10 @@ def main():
                 os.environ["CHAKRAM_HEADLESS"] = "1"
                 print("Running in headless mode (no GUI)")
             
+            # Set quiet mode in environment if specified
+            if args.quiet:
+                os.environ["CHAKRAM_QUIET"] = "1"
+            
             print("Starting Chakram X Alternative Control System for Mortal Online 2...")
             return run_main()
         except KeyboardInterrupt:
@@ -4,11 +4,17 @@ Handles joystick input and key simulation with adaptive control system.
 """
 
 import math
+import os
 import threading
 import time
 import queue
 import pygame
-from src.win_input import key_down, key_up, send_sector_change, right_mouse_down, right_mouse_up, move_mouse, get_cursor_position
+from src.win_input import (
+    key_down, key_up, batch_key_up, middle_mouse_down, middle_mouse_up, send_sector_change,
+    begin_sector_change, finish_sector_change,
+    right_mouse_down, right_mouse_up, move_mouse, get_cursor_position, is_key_pressed,
+    begin_timer_resolution, end_timer_resolution, raise_thread_priority, get_vk_code, GetAsyncKeyState
+)
 from src.config import (
     SECTORS, KEY_MAPPINGS, DEADZONE, DEADZONE_TIME_THRESHOLD, DEADZONE_SPEED_THRESHOLD, 
     RELEASE_DELAY, SECTOR_CHANGE_COOLDOWN, ALT_MODE_KEY, ALT_MODE_CURSOR_OFFSET,
@@ -20,48 +26,158 @@ from src.config import (
 )
 from src.movement_analyzer import MovementAnalyzer
 from src.game_state_detector import GameStateDetector
+from src.sectors import build_sector_lut, lookup_sector
+
+# Joystick events drained by the controller thread every tick (the main loop never uses them)
+JOYSTICK_EVENT_TYPES = [
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP
+]
+
+# Axis changes below this are treated as sensor noise when deciding whether a tick can be skipped
+STICK_NOISE_EPSILON = 1e-3
+
+# Quick-movement detection compares squared speeds, so no sqrt is needed per tick
+DEADZONE_SPEED_THRESHOLD_SQ = DEADZONE_SPEED_THRESHOLD * DEADZONE_SPEED_THRESHOLD
+
+# Controller loop sleep: short while the stick is in use, back to ~100Hz once it has rested a while
+ACTIVE_POLL_INTERVAL = 0.002
+IDLE_POLL_INTERVAL = 0.01
+IDLE_AFTER = 0.2
+
+# How long the cancel key is held for a cancel button press (released by a later tick)
+CANCEL_HOLD_TIME = 0.05
+
+# How long the cancel key is held during a sector change before it is released and the new
+# attack key is pressed (finished by a later tick)
+SECTOR_CHANGE_CANCEL_HOLD = 0.01
+
+# Every key the controller can hold owns one bit of the pressed-key mask
+_BIT_KEYS = tuple(dict.fromkeys(list(KEY_MAPPINGS.values()) + ["middle_mouse"]))
+_KEY_BITS = {key: 1 << index for index, key in enumerate(_BIT_KEYS)}
 
 class ChakramController:
+    # update() reads and writes many of these per tick; fixed slots avoid a per-instance __dict__
+    # (every attribute assigned in this class must be listed here)
+    __slots__ = (
+        "adaptive_enabled", "alt_mode_active", "alt_mode_current_sector", "alt_mode_deadzone",
+        "alt_mode_key_pressed", "alt_mode_right_mouse_down", "combat_mode_active",
+        "combat_mode_enabled", "combat_mode_key_pressed", "current_deadzone", "current_sector",
+        "current_state", "deadzone_entry_position", "deadzone_entry_time", "deadzone_exit_position",
+        "deadzone_exit_time", "deadzone_speed_sq", "deadzone_timeout", "debug_info",
+        "dynamic_deadzone_enabled", "game_state_detector", "in_deadzone", "joystick",
+        "last_active_sector", "last_position", "last_position_time", "last_sector_change_time",
+        "last_update_time", "movement_analyzer", "predicted_sector", "prediction_confidence",
+        "prediction_enabled", "sector_change_cooldown", "sector_change_in_progress",
+        "sector_change_timeout", "suggested_interval", "thread",
+        "_alt_mode_deadzone_sq", "_alt_mode_vk", "_attack_key_set", "_cached_eff_dz",
+        "_cached_eff_dz_sq", "_cancel_button_down", "_cancel_key", "_cursor_directions",
+        "_deadzone_sq", "_debug_pressed_mask", "_get_axis", "_get_button", "_has_cancel_button",
+        "_joystick_read_failed", "_key_log_queue", "_key_log_thread", "_last_activity_time",
+        "_last_angle", "_last_x", "_last_y", "_num_axes", "_num_buttons",
+        "_pending_cancel_release_at", "_pending_sector_finish", "_pressed_mask", "_sector_keys",
+        "_sector_lut", "_stop_event", "_tick_settled", "_tick_time", "_verbose",
+        "_wall_clock_offset",
+    )
+    
     def __init__(self):
         """Initialize the controller."""
         self.joystick = None
+        # Joystick capabilities are constant once opened; cached by _cache_joystick_caps
+        self._num_axes = 0
+        self._num_buttons = 0
+        self._get_axis = None
+        self._get_button = None
+        self._has_cancel_button = False
+        self._joystick_read_failed = False  # Set while a lost joystick makes reads fail
         self.current_sector = None
         self.current_state = None  # "neutral", "cancel", "attack"
-        self.pressed_keys = set()
+        self._pressed_mask = 0  # Bitmask over _BIT_KEYS, see the pressed_keys property
         
-        # Thread for background processing
-        self.running = False
+        # Thread for background processing; setting the stop event also wakes it from its sleep
+        self._stop_event = threading.Event()
         self.thread = None
         
-        # Key event queue and processing thread
-        self.key_event_queue = queue.Queue()
-        self.key_event_thread = None
-        self.key_event_thread_running = False
         self.sector_change_in_progress = False
         
+        # Key action and status log: the input path only enqueues records, a daemon thread prints them.
+        # Quiet mode (run.py --quiet) skips even the enqueue.
+        self._verbose = os.environ.get("CHAKRAM_QUIET") != "1"
+        self._key_log_queue = queue.SimpleQueue()
+        # Records carry the per-tick perf_counter sample; the offset maps it back to wall-clock time
+        self._wall_clock_offset = time.time() - time.perf_counter()
+        self._tick_time = time.perf_counter()
+        self._key_log_thread = threading.Thread(target=self._key_log_worker, daemon=True)
+        self._key_log_thread.start()
+        
         # Sector change cooldown to prevent rapid changes
         self.last_sector_change_time = 0
         self.sector_change_cooldown = SECTOR_CHANGE_COOLDOWN
         
         # Position tracking for speed calculation
         self.last_position = (0, 0)
-        self.last_position_time = time.time()
+        self.last_position_time = time.perf_counter()
         self.in_deadzone = False
         self.deadzone_entry_time = 0
         self.deadzone_entry_position = (0, 0)
         self.deadzone_exit_time = 0
         self.deadzone_exit_position = (0, 0)
-        self.deadzone_speed = 0
+        self.deadzone_speed_sq = 0.0  # Squared speed of the last tick spent in the deadzone
         
         # Track the last active sector before entering deadzone
         self.last_active_sector = None
         
+        # Last computed joystick angle (reused while the stick rests inside the deadzone)
+        self._last_angle = 0.0
+        
+        # Position of the last fully processed tick, and whether that tick left nothing pending;
+        # together they let update() skip ticks while the stick rests
+        self._last_x = 0.0
+        self._last_y = 0.0
+        self._tick_settled = False
+        
+        # Sleep the background thread should use before the next tick (see ACTIVE/IDLE_POLL_INTERVAL)
+        self.suggested_interval = ACTIVE_POLL_INTERVAL
+        self._last_activity_time = 0.0
+        
+        # Cancel button edge tracking; the cancel key is released once the hold deadline passes
+        self._cancel_button_down = False
+        self._pending_cancel_release_at = None
+        
+        # A started sector change as (finish deadline, old sector, new sector), see _start_sector_change
+        self._pending_sector_finish = None
+        
+        # Sector boundaries are fixed at startup, so resolve angles through a lookup table
+        self._sector_lut = build_sector_lut(SECTORS)
+        
+        # Key mappings never change at runtime, so resolve each sector's attack key once
+        self._sector_keys = {sector: KEY_MAPPINGS[sector] for sector in SECTORS}
+        
+        # Attack keys (one per sector) that must not be pressed while alt mode is active
+        self._attack_key_set = frozenset(self._sector_keys.values())
+        self._cancel_key = KEY_MAPPINGS["cancel"]
+        
         # Alternative mode
+        self.alt_mode_deadzone = DEADZONE * 0.8  # 20% smaller deadzone for alt mode
         self.alt_mode_active = False
         self.alt_mode_key_pressed = False
         self.alt_mode_current_sector = None
         self.alt_mode_right_mouse_down = False
         
+        # The alt mode key is polled every tick, so resolve its virtual-key code once
+        self._alt_mode_vk = get_vk_code(ALT_MODE_KEY)
+        if self._alt_mode_vk is None:
+            print(f"Error: Alt mode key '{ALT_MODE_KEY}' not found in VK_CODES")
+        
+        # Cursor offset per sector for alt mode, built once instead of on every cursor move
+        offset = ALT_MODE_CURSOR_OFFSET
+        self._cursor_directions = {
+            "right": (offset, 0),
+            "left": (-offset, 0),
+            "overhead": (0, -offset),
+            "thrust": (0, offset)
+        }
+        
         # Adaptive control system
         self.adaptive_enabled = ADAPTIVE_ENABLED
         self.movement_analyzer = MovementAnalyzer(history_size=15)
@@ -76,6 +192,13 @@ class ChakramController:
         self.dynamic_deadzone_enabled = DYNAMIC_DEADZONE_ENABLED
         self.current_deadzone = DEADZONE
         
+        # Squared deadzones and the effective deadzone resolved once per tick,
+        # so the per-frame distance checks are plain compares
+        self._deadzone_sq = DEADZONE * DEADZONE
+        self._alt_mode_deadzone_sq = self.alt_mode_deadzone * self.alt_mode_deadzone
+        self._cached_eff_dz = DEADZONE
+        self._cached_eff_dz_sq = self._deadzone_sq
+        
         # Prediction
         self.prediction_enabled = PREDICTION_ENABLED
         self.predicted_sector = None
@@ -101,11 +224,14 @@ class ChakramController:
             "game_state": "exploration",
             "movement_speed": 0.0,
             "transition_smoothness": COMBAT_MODE_TRANSITION_SMOOTHNESS,  # Use combat mode smoothness
-            "movement_trail": []  # Store recent positions for trail visualization
+            # Live view of recent positions for trail visualization (no per-frame copy)
+            "movement_trail": self.movement_analyzer.trail_view() if self.adaptive_enabled else []
         }
+        # Pressed-key mask last published as debug_info["pressed_keys"]
+        self._debug_pressed_mask = 0
         
         # Safety mechanism to prevent infinite loops
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
         self.deadzone_timeout = 0.5  # Timeout in seconds to force exit from deadzone
         self.sector_change_timeout = 0.2  # Timeout for sector change operations
     
@@ -122,6 +248,7 @@ class ChakramController:
                 
                 # Check if the joystick has working axes
                 if self._check_joystick_axes(self.joystick):
+                    self._cache_joystick_caps()
                     print(f"Initialized joystick: {self.joystick.get_name()} (ID: {joystick_id})")
                     return True
                 else:
@@ -166,6 +293,7 @@ class ChakramController:
             for joystick_id, joystick in chakram_joysticks:
                 if self._check_joystick_axes(joystick):
                     self.joystick = joystick
+                    self._cache_joystick_caps()
                     print(f"Using Chakram X joystick: {joystick.get_name()} (ID: {joystick_id})")
                     return True
             
@@ -200,29 +328,48 @@ class ChakramController:
             print(f"  Error checking joystick axes: {e}")
             return False
     
+    def _cache_joystick_caps(self):
+        """Query the selected joystick's capabilities and bind its getters once."""
+        self._num_axes = self.joystick.get_numaxes()
+        self._num_buttons = self.joystick.get_numbuttons()
+        self._get_axis = self.joystick.get_axis
+        self._get_button = self.joystick.get_button
+        self._has_cancel_button = self._num_buttons > 0
+    
     def get_joystick_position(self):
         """Get the current joystick position as (x, y) coordinates."""
         if not self.joystick:
             return (0, 0)
         
-        x = self.joystick.get_axis(0)
-        y = self.joystick.get_axis(1)
-        return (x, y)
+        get_axis = self._get_axis
+        return (get_axis(0), get_axis(1))
+    
+    def _position_r2(self):
+        """
+        Get the current joystick position and its squared distance from center.
+        Returns (x, y, distance_sq) so callers can test against the deadzone without sqrt/atan2.
+        """
+        x, y = self.get_joystick_position()
+        return (x, y, x*x + y*y)
+    
+    @staticmethod
+    def _angle_of(x, y):
+        """Convert a joystick position to an angle in degrees (0° is right, 90° is down)."""
+        # atan2 yields (-180°, 180°]; fold negatives into [0°, 360°] without a branch
+        return math.degrees(math.atan2(y, x)) % 360.0
     
     def get_joystick_angle_and_distance(self):
         """
         Convert joystick position to angle (in degrees) and distance from center.
         Returns (angle, distance) tuple.
         """
-        x, y = self.get_joystick_position()
+        x, y, distance_sq = self._position_r2()
         
         # Calculate angle (in degrees, 0° is right, 90° is down)
-        angle = math.degrees(math.atan2(y, x))
-        if angle < 0:
-            angle += 360
+        angle = self._angle_of(x, y)
             
         # Calculate distance from center (0.0 to 1.0)
-        distance = min(1.0, math.sqrt(x*x + y*y))
+        distance = min(1.0, math.sqrt(distance_sq))
         
         return (angle, distance)
     
@@ -234,11 +381,8 @@ class ChakramController:
         With adaptive control system, this uses dynamic deadzone and prediction
         to provide more intuitive control.
         """
-        # Get the effective deadzone based on movement patterns and game state
-        effective_deadzone = self.get_effective_deadzone()
-        
-        # Don't determine sector if within deadzone
-        if distance < effective_deadzone:
+        # Don't determine sector if within the effective deadzone (resolved once per tick in update)
+        if distance < self._cached_eff_dz:
             return None
         
         # If prediction is enabled and we have a predicted sector with high confidence,
@@ -247,20 +391,9 @@ class ChakramController:
             self.predicted_sector and self.prediction_confidence > PREDICTION_CONFIDENCE_THRESHOLD):
             return self.predicted_sector
             
-        # Standard sector determination
-        for sector_name, sector_range in SECTORS.items():
-            start = sector_range["start"]
-            end = sector_range["end"]
-            
-            # Handle sector that wraps around 0°
-            if start > end:
-                if angle >= start or angle <= end:
-                    return sector_name
-            else:
-                if start <= angle <= end:
-                    return sector_name
-                    
-        return None  # Should not happen if sectors cover all 360°
+        # Standard sector determination: a table index per frame, scanned only next to a bound
+        # (None only if the configured sectors do not cover all 360°)
+        return lookup_sector(self._sector_lut, SECTORS, angle)
     
     def get_effective_deadzone(self):
         """
@@ -336,50 +469,51 @@ class ChakramController:
         else:
             return start <= angle <= end
     
+    @property
+    def pressed_keys(self):
+        """List of the currently pressed keys, decoded from the pressed-key mask."""
+        return self._keys_in_mask(self._pressed_mask)
+    
+    @staticmethod
+    def _keys_in_mask(mask):
+        """Decode a pressed-key mask into key names, lowest bit first."""
+        keys = []
+        while mask:
+            lowest_bit = mask & -mask
+            keys.append(_BIT_KEYS[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return keys
+    
     def press_key(self, key):
         """
-        Press a key and add it to the pressed keys set.
+        Press a key and set its bit in the pressed-key mask.
         Uses optimized key_down function for maximum speed.
         Supports middle mouse button.
         """
-        # Don't press attack keys if in alt mode
-        if self.alt_mode_active:
-            # Check if this is an attack key (one of the sector keys)
-            attack_keys = [KEY_MAPPINGS[sector] for sector in SECTORS.keys()]
-            if key in attack_keys:
-                print(f"Ignoring attack key press in alt mode: {key}")
-                return False
+        # Don't press attack keys (one of the sector keys) if in alt mode
+        if self.alt_mode_active and key in self._attack_key_set:
+            self._log_message("Ignoring attack key press in alt mode: %s", key)
+            return False
         
-        if key not in self.pressed_keys:
+        key_bit = _KEY_BITS[key]
+        if not self._pressed_mask & key_bit:
             try:
                 if key == "middle_mouse":
-                    # Import the optimized function for middle mouse down
-                    from src.win_input import middle_mouse_down
-                    
                     # Send middle mouse down event
                     if middle_mouse_down():
-                        self.pressed_keys.add(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] PRESS: {key}")
+                        self._pressed_mask |= key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, False)
                         return True
                     else:
                         print(f"Failed to press middle mouse button")
                         return False
                 else:
-                    # Import the optimized function for key down
-                    from src.win_input import key_down
-                    
                     # Send key down event
                     if key_down(key):
-                        self.pressed_keys.add(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] PRESS: {key}")
+                        self._pressed_mask |= key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, False)
                         return True
                     else:
                         print(f"Failed to press key: {key}")
@@ -391,40 +525,29 @@ class ChakramController:
     
     def release_key(self, key):
         """
-        Release a key and remove it from the pressed keys set.
+        Release a key and clear its bit in the pressed-key mask.
         Uses optimized key_up function for maximum speed.
         Supports middle mouse button.
         """
-        if key in self.pressed_keys:
+        key_bit = _KEY_BITS[key]
+        if self._pressed_mask & key_bit:
             try:
                 if key == "middle_mouse":
-                    # Import the optimized function for middle mouse up
-                    from src.win_input import middle_mouse_up
-                    
                     # Send middle mouse up event
                     if middle_mouse_up():
-                        self.pressed_keys.remove(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] RELEASE: {key}")
+                        self._pressed_mask &= ~key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, True)
                         return True
                     else:
                         print(f"Failed to release middle mouse button")
                         return False
                 else:
-                    # Import the optimized function for key up
-                    from src.win_input import key_up
-                    
                     # Send key up event
                     if key_up(key):
-                        self.pressed_keys.remove(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] RELEASE: {key}")
+                        self._pressed_mask &= ~key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, True)
                         return True
                     else:
                         print(f"Failed to release key: {key}")
@@ -436,45 +559,39 @@ class ChakramController:
     
     def release_all_keys(self):
         """Release all pressed keys in a single atomic operation for maximum speed."""
-        if not self.pressed_keys:
+        if not self._pressed_mask:
             return
         
         try:
-            # Handle middle mouse button separately
-            has_middle_mouse = "middle_mouse" in self.pressed_keys
-            regular_keys = [key for key in self.pressed_keys if key != "middle_mouse"]
-            
-            # Release regular keys
-            if regular_keys:
-                # Release each key individually
-                for key in regular_keys:
-                    from src.win_input import key_up
-                    key_up(key)
-                    self._log_key_action(key, True, batch=True)
-            
-            # Release middle mouse button if pressed
+            # Split the middle mouse button from the keyboard keys
+            middle_mouse_bit = _KEY_BITS["middle_mouse"]
+            has_middle_mouse = bool(self._pressed_mask & middle_mouse_bit)
+            regular_keys = self._keys_in_mask(self._pressed_mask & ~middle_mouse_bit)
+            
+            # Release the regular keys and the middle mouse button in one batched input call
+            batch_key_up(regular_keys, middle_mouse=has_middle_mouse)
+            # Queue the whole batch as a single log record
             if has_middle_mouse:
-                from src.win_input import middle_mouse_up
-                middle_mouse_up()
-                self._log_key_action("middle_mouse", True, batch=True)
+                regular_keys.append("middle_mouse")
+            self._log_key_action(tuple(regular_keys), True, batch=True)
             
-            # Clear the pressed keys set
-            self.pressed_keys.clear()
+            # Clear the pressed keys mask
+            self._pressed_mask = 0
         except Exception as e:
             print(f"Error releasing all keys: {e}")
             # Fallback to individual key releases if the atomic operation fails
-            for key in list(self.pressed_keys):
+            for key in self.pressed_keys:
                 self.release_key(key)
-            self.pressed_keys.clear()
+            self._pressed_mask = 0
     
     def _log_key_action(self, key, is_up, batch=False):
-        """Log key action with timestamp."""
-        timestamp = time.time()
-        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-        ms = int((timestamp - int(timestamp)) * 1000)
-        action = "RELEASE" if is_up else "PRESS"
-        batch_prefix = "BATCH " if batch else ""
-        print(f"[{formatted_time}.{ms:03d}] {batch_prefix}{action}: {key}")
+        """
+        Log key action with timestamp.
+        Only the raw record is queued here; formatting and printing happen on the
+        key log thread so they stay off the input path. A batch may pass a tuple of keys.
+        """
+        if self._verbose:
+            self._key_log_queue.put((self._tick_time, key, is_up, batch))
     
     def calculate_movement_speed(self, pos1, pos2, time1, time2):
         """Calculate the speed of movement between two positions."""
@@ -485,7 +602,7 @@ class ChakramController:
         x2, y2 = pos2
         
         # Calculate distance between positions
-        distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        distance = math.hypot(x2 - x1, y2 - y1)
         
         # Calculate time difference
         time_diff = time2 - time1
@@ -542,20 +659,8 @@ class ChakramController:
     
     def move_cursor_in_direction(self, sector):
         """Move the cursor in the direction corresponding to the sector."""
-        # Get the cursor offset from config
-        offset = ALT_MODE_CURSOR_OFFSET
-        
-        # Use a lookup table for faster direction determination
-        # This avoids multiple if-else checks
-        direction_map = {
-            "right": (offset, 0),
-            "left": (-offset, 0),
-            "overhead": (0, -offset),
-            "thrust": (0, offset)
-        }
-        
-        # Get direction from map or default to (0,0)
-        dx, dy = direction_map.get(sector, (0, 0))
+        # Get direction from the prebuilt lookup table or default to (0,0)
+        dx, dy = self._cursor_directions.get(sector, (0, 0))
         
         if dx == 0 and dy == 0:
             return  # Unknown sector
@@ -580,8 +685,9 @@ class ChakramController:
     
     def update(self):
         """Update the controller state and simulate key presses."""
-        # Get current time
-        current_time = time.time()
+        # Sample the monotonic clock once per tick; everything below reuses it
+        current_time = time.perf_counter()
+        self._tick_time = current_time
         
         # Safety mechanism to prevent infinite loops or getting stuck
         time_since_last_update = current_time - self.last_update_time
@@ -600,11 +706,6 @@ class ChakramController:
                 self.predicted_sector = self.movement_analyzer.predict_next_sector(
                     SECTORS, self.current_sector, self.get_effective_deadzone())
                 self.prediction_confidence = movement_metrics["prediction_confidence"]
-            
-            # Update movement trail for visualization
-            # Get the last 10 positions from the movement analyzer
-            if hasattr(self.movement_analyzer, 'position_history') and len(self.movement_analyzer.position_history) > 0:
-                self.debug_info["movement_trail"] = list(self.movement_analyzer.position_history)
         
         # Check for combat mode toggle with keyboard key
         if self.combat_mode_enabled:
@@ -612,8 +713,8 @@ class ChakramController:
             
         # Also allow combat mode toggle with joystick button
         try:
-            if self.joystick and self.joystick.get_numbuttons() > 1:
-                combat_button_pressed = self.joystick.get_button(1)  # Second button
+            if self._num_buttons > 1:
+                combat_button_pressed = self._get_button(1)  # Second button
                 
                 # Toggle combat mode on button press
                 if combat_button_pressed and not self.combat_mode_key_pressed:
@@ -635,7 +736,7 @@ class ChakramController:
             # Alt key just pressed - activate alt mode
             self.alt_mode_active = True
             self.alt_mode_key_pressed = True
-            print("Alternative mode activated")
+            self._log_message("Alternative mode activated")
             
             # Release all keys from standard mode
             self.release_all_keys()
@@ -647,7 +748,7 @@ class ChakramController:
             # Alt key just released - deactivate alt mode
             self.alt_mode_active = False
             self.alt_mode_key_pressed = False
-            print("Alternative mode deactivated")
+            self._log_message("Alternative mode deactivated")
             
             # Clean up alt mode
             self.exit_alt_mode()
@@ -658,6 +759,8 @@ class ChakramController:
         # Get effective deadzone based on movement patterns and game state
         effective_deadzone = self.get_effective_deadzone()
         self.current_deadzone = effective_deadzone
+        self._cached_eff_dz = effective_deadzone
+        self._cached_eff_dz_sq = effective_deadzone * effective_deadzone
         
         # Simplified deadzone detection - use a direct approach with dynamic deadzone
         was_in_deadzone = self.in_deadzone
@@ -674,7 +777,7 @@ class ChakramController:
         # Store the speed for use in deadzone exit logic
         if self.in_deadzone:
             # Update the speed while in deadzone to get the most recent value
-            self.deadzone_speed = movement_speed
+            self.deadzone_speed_sq = movement_speed * movement_speed
         
         # Update game state detector if enabled
         if GAME_STATE_DETECTION_ENABLED:
@@ -684,12 +787,12 @@ class ChakramController:
         # If we just entered the deadzone
         if self.in_deadzone and not was_in_deadzone:
             self.deadzone_entry_time = current_time
-            print(f"Entered deadzone at {current_time:.3f}")
+            self._log_message("Entered deadzone at %.3f", current_time)
             
             # Store the last active sector before entering deadzone
             if self.current_sector is not None:
                 self.last_active_sector = self.current_sector
-                print(f"Stored last active sector: {self.last_active_sector}")
+                self._log_message("Stored last active sector: %s", self.last_active_sector)
             
             # Reset sector change flag when entering deadzone
             self.sector_change_in_progress = False
@@ -699,8 +802,8 @@ class ChakramController:
             deadzone_time = current_time - self.deadzone_entry_time
             
             # If we've been in the deadzone for longer than the threshold, release attack buttons
-            if deadzone_time >= DEADZONE_TIME_THRESHOLD and len(self.pressed_keys) > 0:
-                print(f"In deadzone for {deadzone_time:.3f}s, releasing all attack keys")
+            if deadzone_time >= DEADZONE_TIME_THRESHOLD and self._pressed_mask:
+                self._log_message("In deadzone for %.3fs, releasing all attack keys", deadzone_time)
                 self.release_all_keys()
                 
                 # Update state
@@ -709,7 +812,7 @@ class ChakramController:
         
         # If we just exited the deadzone
         if not self.in_deadzone and was_in_deadzone:
-            print(f"Exited deadzone at {current_time:.3f}")
+            self._log_message("Exited deadzone at %.3f", current_time)
             
             # Reset sector change flag when exiting deadzone
             self.sector_change_in_progress = False
@@ -722,14 +825,14 @@ class ChakramController:
             if (new_sector is not None and 
                 self.last_active_sector is not None and 
                 new_sector != self.last_active_sector):
-                print(f"Detected sector change through deadzone: {self.last_active_sector} -> {new_sector}")
+                self._log_message("Detected sector change through deadzone: %s -> %s", self.last_active_sector, new_sector)
                 
                 # Set the sector change flag and update the last change time
                 self.sector_change_in_progress = True
                 self.last_sector_change_time = current_time
                 
                 # Handle the sector change directly
-                self._enqueue_sector_change(self.last_active_sector, new_sector)
+                self._enqueue_sector_change(self.last_active_sector, new_sector, distance)
                 
                 # Update current sector to the new one
                 self.current_sector = new_sector
@@ -766,7 +869,7 @@ class ChakramController:
         if self.adaptive_enabled:
             quick_movement = self.movement_analyzer.is_quick_movement(DEADZONE_SPEED_THRESHOLD)
         else:
-            quick_movement = self.deadzone_speed > DEADZONE_SPEED_THRESHOLD
+            quick_movement = self.deadzone_speed_sq > DEADZONE_SPEED_THRESHOLD_SQ
         
         # Update debug info
         self.debug_info["position"] = current_position
@@ -774,8 +877,8 @@ class ChakramController:
         self.debug_info["distance"] = distance
         self.debug_info["sector"] = new_sector
         self.debug_info["state"] = new_state
-        self.debug_info["pressed_keys"] = list(self.pressed_keys)
-        self.debug_info["deadzone_speed"] = self.deadzone_speed
+        self.debug_info["pressed_keys"] = self.pressed_keys
+        self.debug_info["deadzone_speed"] = math.sqrt(self.deadzone_speed_sq)
         self.debug_info["quick_movement"] = quick_movement
         self.debug_info["alt_mode_active"] = self.alt_mode_active
         self.debug_info["alt_mode_sector"] = self.alt_mode_current_sector
@@ -785,15 +888,13 @@ class ChakramController:
         self.debug_info["predicted_sector"] = self.predicted_sector
         self.debug_info["prediction_confidence"] = self.prediction_confidence
         self.debug_info["game_state"] = self.game_state_detector.current_state if GAME_STATE_DETECTION_ENABLED else "unknown"
-        self.debug_info["movement_speed"] = self.movement_analyzer.current_speed if self.adaptive_enabled else movement_speed
-        self.debug_info["transition_smoothness"] = self.get_transition_smoothness()
         
         # Skip processing if a sector change is already in progress
         # But add a timeout to prevent getting stuck
         if self.sector_change_in_progress:
             # Check if we've been stuck for too long
             if time_since_last_update > self.sector_change_timeout:
-                print(f"Sector change taking too long ({time_since_last_update:.3f}s). Forcing reset.")
+                self._log_message("Sector change taking too long (%.3fs). Forcing reset.", time_since_last_update)
                 self.sector_change_in_progress = False
                 # Continue processing this frame instead of returning
             else:
@@ -809,24 +910,24 @@ class ChakramController:
         # Check for cancel button press in any state
         try:
             # Check if joystick has buttons
-            if self.joystick and self.joystick.get_numbuttons() > 0:
+            if self._num_buttons > 0:
                 # Check the first button (usually the main/cancel button)
-                if self.joystick.get_button(0):
+                if self._get_button(0):
                     # Press and release the cancel key
                     cancel_key = KEY_MAPPINGS["cancel"]
                     self.press_key(cancel_key)
                     # Release after a very short delay
                     time.sleep(0.01)  # Reduced from 0.05 to 0.01 for faster response
                     self.release_key(cancel_key)
-                    print("Cancel button pressed")
+                    self._log_message("Cancel button pressed")
                     cancel_pressed = True
                     
                     # If we're in an attack state, also release the attack key
                     if self.current_state == "attack" and self.current_sector:
                         attack_key = KEY_MAPPINGS[self.current_sector]
-                        if attack_key in self.pressed_keys:
+                        if self._pressed_mask & _KEY_BITS[attack_key]:
                             self.release_key(attack_key)
-                            print(f"Released attack key {attack_key} due to cancel button press")
+                            self._log_message("Released attack key %s due to cancel button press", attack_key)
         except Exception as e:
             print(f"Error checking cancel button: {e}")
             
@@ -836,12 +937,9 @@ class ChakramController:
             if self.current_sector is not None and new_sector is not None:
                 # If we've quickly moved through the deadzone, use atomic operation for maximum speed
                 if quick_movement and was_in_deadzone:
-                    print(f"Quick movement through deadzone detected (speed: {self.deadzone_speed:.2f}). Using atomic operation.")
+                    self._log_message("Quick movement through deadzone detected (speed: %.2f). Using atomic operation.", math.sqrt(self.deadzone_speed_sq))
                     
                     try:
-                        # Import the optimized function for sending sector change
-                        from src.win_input import send_sector_change
-                        
                         cancel_key = KEY_MAPPINGS["cancel"]
                         old_attack_key = KEY_MAPPINGS[self.current_sector]
                         new_attack_key = KEY_MAPPINGS[new_sector]
@@ -854,18 +952,18 @@ class ChakramController:
                         send_sector_change(cancel_key, old_attack_key, new_attack_key, 0)
                         
                         # Update the pressed keys set
-                        if old_attack_key in self.pressed_keys:
-                            self.pressed_keys.remove(old_attack_key)
+                        if self._pressed_mask & _KEY_BITS[old_attack_key]:
+                            self._pressed_mask &= ~_KEY_BITS[old_attack_key]
                             self._log_key_action(old_attack_key, True, batch=True)
                         
-                        self.pressed_keys.add(new_attack_key)
+                        self._pressed_mask |= _KEY_BITS[new_attack_key]
                         self._log_key_action(cancel_key, False, batch=True)
                         self._log_key_action(cancel_key, True, batch=True)
                         self._log_key_action(new_attack_key, False, batch=True)
                     except Exception as e:
                         print(f"Error during quick movement handling: {e}")
                         # Fallback to individual key operations if the atomic operation fails
-                        if self.current_sector and KEY_MAPPINGS[self.current_sector] in self.pressed_keys:
+                        if self.current_sector and self._pressed_mask & _KEY_BITS[KEY_MAPPINGS[self.current_sector]]:
                             self.release_key(KEY_MAPPINGS[self.current_sector])
                         
                         if new_sector:
@@ -878,9 +976,9 @@ class ChakramController:
                     # Set the sector change flag and update the last change time
                     self.sector_change_in_progress = True
                     self.last_sector_change_time = current_time
-                    print(f"Starting sector change: {self.current_sector} -> {new_sector}")
+                    self._log_message("Starting sector change: %s -> %s", self.current_sector, new_sector)
                     # Handle the sector change directly
-                    self._enqueue_sector_change(self.current_sector, new_sector)
+                    self._enqueue_sector_change(self.current_sector, new_sector, distance)
             elif new_state == "attack" and new_sector:
                 # If we're entering a sector from neutral, just press the attack key
                 new_attack_key = KEY_MAPPINGS[new_sector]
@@ -903,9 +1001,6 @@ class ChakramController:
     def check_combat_mode_toggle(self):
         """Check if the combat mode key is pressed and toggle combat mode."""
         try:
-            # Import the optimized function for checking key state
-            from src.win_input import is_key_pressed
-            
             # Check if the combat mode key is pressed
             combat_key_pressed = is_key_pressed(COMBAT_MODE_KEY)
             
@@ -933,48 +1028,38 @@ class ChakramController:
     
     def press_key(self, key):
         """
-        Press a key and add it to the pressed keys set.
+        Press a key and set its bit in the pressed-key mask.
         Uses optimized key_down function for maximum speed.
         Supports middle mouse button.
         """
-        # Don't press attack keys if in alt mode
-        if self.alt_mode_active:
-            # Check if this is an attack key (one of the sector keys)
-            attack_keys = [KEY_MAPPINGS[sector] for sector in SECTORS.keys()]
-            if key in attack_keys:
-                print(f"Ignoring attack key press in alt mode: {key}")
-                return False
+        # Don't press attack keys (one of the sector keys) if in alt mode
+        if self.alt_mode_active and key in self._attack_key_set:
+            self._log_message("Ignoring attack key press in alt mode: %s", key)
+            return False
         
-        if key not in self.pressed_keys:
+        key_bit = _KEY_BITS.get(key)
+        if key_bit is None:
+            # Only keys from KEY_MAPPINGS have a bit in the pressed-key mask
+            print(f"Failed to press key: {key} (not in KEY_MAPPINGS)")
+            return False
+        if not self._pressed_mask & key_bit:
             try:
                 if key == "middle_mouse":
-                    # Import the optimized function for middle mouse down
-                    from src.win_input import middle_mouse_down
-                    
                     # Send middle mouse down event
                     if middle_mouse_down():
-                        self.pressed_keys.add(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] PRESS: {key}")
+                        self._pressed_mask |= key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, False)
                         return True
                     else:
                         print(f"Failed to press middle mouse button")
                         return False
                 else:
-                    # Import the optimized function for key down
-                    from src.win_input import key_down
-                    
                     # Send key down event
                     if key_down(key):
-                        self.pressed_keys.add(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] PRESS: {key}")
+                        self._pressed_mask |= key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, False)
                         return True
                     else:
                         print(f"Failed to press key: {key}")
@@ -986,40 +1071,33 @@ class ChakramController:
     
     def release_key(self, key):
         """
-        Release a key and remove it from the pressed keys set.
+        Release a key and clear its bit in the pressed-key mask.
         Uses optimized key_up function for maximum speed.
         Supports middle mouse button.
         """
-        if key in self.pressed_keys:
+        key_bit = _KEY_BITS.get(key)
+        if key_bit is None:
+            # A key outside KEY_MAPPINGS can never have been pressed through press_key
+            print(f"Failed to release key: {key} (not in KEY_MAPPINGS)")
+            return False
+        if self._pressed_mask & key_bit:
             try:
                 if key == "middle_mouse":
-                    # Import the optimized function for middle mouse up
-                    from src.win_input import middle_mouse_up
-                    
                     # Send middle mouse up event
                     if middle_mouse_up():
-                        self.pressed_keys.remove(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] RELEASE: {key}")
+                        self._pressed_mask &= ~key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, True)
                         return True
                     else:
                         print(f"Failed to release middle mouse button")
                         return False
                 else:
-                    # Import the optimized function for key up
-                    from src.win_input import key_up
-                    
                     # Send key up event
                     if key_up(key):
-                        self.pressed_keys.remove(key)
-                        # Print trace with timestamp
-                        timestamp = time.time()
-                        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-                        ms = int((timestamp - int(timestamp)) * 1000)
-                        print(f"[{formatted_time}.{ms:03d}] RELEASE: {key}")
+                        self._pressed_mask &= ~key_bit
+                        # Trace with timestamp (formatted off the input thread)
+                        self._log_key_action(key, True)
                         return True
                     else:
                         print(f"Failed to release key: {key}")
@@ -1031,45 +1109,85 @@ class ChakramController:
     
     def release_all_keys(self):
         """Release all pressed keys in a single atomic operation for maximum speed."""
-        if not self.pressed_keys:
+        if not self._pressed_mask:
             return
         
         try:
-            # Handle middle mouse button separately
-            has_middle_mouse = "middle_mouse" in self.pressed_keys
-            regular_keys = [key for key in self.pressed_keys if key != "middle_mouse"]
-            
-            # Release regular keys
-            if regular_keys:
-                # Release each key individually
-                for key in regular_keys:
-                    from src.win_input import key_up
-                    key_up(key)
-                    self._log_key_action(key, True, batch=True)
-            
-            # Release middle mouse button if pressed
+            # Split the middle mouse button from the keyboard keys
+            middle_mouse_bit = _KEY_BITS["middle_mouse"]
+            has_middle_mouse = bool(self._pressed_mask & middle_mouse_bit)
+            regular_keys = self._keys_in_mask(self._pressed_mask & ~middle_mouse_bit)
+            
+            # Release the regular keys and the middle mouse button in one batched input call
+            batch_key_up(regular_keys, middle_mouse=has_middle_mouse)
+            # Queue the whole batch as a single log record
             if has_middle_mouse:
-                from src.win_input import middle_mouse_up
-                middle_mouse_up()
-                self._log_key_action("middle_mouse", True, batch=True)
+                regular_keys.append("middle_mouse")
+            self._log_key_action(tuple(regular_keys), True, batch=True)
             
-            # Clear the pressed keys set
-            self.pressed_keys.clear()
+            # Clear the pressed keys mask
+            self._pressed_mask = 0
         except Exception as e:
             print(f"Error releasing all keys: {e}")
             # Fallback to individual key releases if the atomic operation fails
-            for key in list(self.pressed_keys):
+            for key in self.pressed_keys:
                 self.release_key(key)
-            self.pressed_keys.clear()
+            self._pressed_mask = 0
     
     def _log_key_action(self, key, is_up, batch=False):
-        """Log key action with timestamp."""
-        timestamp = time.time()
-        formatted_time = time.strftime("%H:%M:%S", time.localtime(timestamp))
-        ms = int((timestamp - int(timestamp)) * 1000)
-        action = "RELEASE" if is_up else "PRESS"
-        batch_prefix = "BATCH " if batch else ""
-        print(f"[{formatted_time}.{ms:03d}] {batch_prefix}{action}: {key}")
+        """
+        Log key action with timestamp.
+        Only the raw record is queued here; formatting and printing happen on the
+        key log thread so they stay off the input path. A batch may pass a tuple of keys.
+        """
+        if self._verbose:
+            self._key_log_queue.put((self._tick_time, key, is_up, batch))
+    
+    def _log_message(self, fmt, *args):
+        """
+        Log a status message from the controller thread.
+        The %-style arguments are only formatted on the key log thread, next to the key actions.
+        """
+        if self._verbose:
+            self._key_log_queue.put((fmt, args))
+    
+    def _key_log_worker(self):
+        """Background thread that formats and prints queued key actions and status messages."""
+        # Records from one tick share a timestamp, so the HH:MM:SS part is only
+        # formatted again when the whole second changes
+        last_second = None
+        formatted_time = ""
+        while True:
+            # Wait for the next record, then drain everything already queued behind it
+            # so a burst (e.g. one sector change) goes out in a single console write
+            records = [self._key_log_queue.get()]
+            try:
+                while True:
+                    records.append(self._key_log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            lines = []
+            for record in records:
+                if len(record) == 2:
+                    fmt, args = record
+                    lines.append(fmt % args)
+                    continue
+                tick_time, key, is_up, batch = record
+                timestamp = tick_time + self._wall_clock_offset
+                second = int(timestamp)
+                if second != last_second:
+                    last_second = second
+                    formatted_time = time.strftime("%H:%M:%S", time.localtime(second))
+                ms = int((timestamp - second) * 1000)
+                action = "RELEASE" if is_up else "PRESS"
+                batch_prefix = "BATCH " if batch else ""
+                prefix = f"[{formatted_time}.{ms:03d}] {batch_prefix}{action}: "
+                if type(key) is tuple:
+                    lines.extend(prefix + batch_key for batch_key in key)
+                else:
+                    lines.append(prefix + key)
+            print("\n".join(lines))
     
     def calculate_movement_speed(self, pos1, pos2, time1, time2):
         """Calculate the speed of movement between two positions."""
@@ -1080,7 +1198,7 @@ class ChakramController:
         x2, y2 = pos2
         
         # Calculate distance between positions
-        distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        distance = math.hypot(x2 - x1, y2 - y1)
         
         # Calculate time difference
         time_diff = time2 - time1
@@ -1094,38 +1212,16 @@ class ChakramController:
     def handle_alt_mode(self, angle, distance):
         """Handle the alternative mode functionality."""
         # Determine sector - use a smaller deadzone for more responsiveness in alt mode
-        alt_mode_deadzone = DEADZONE * 0.8  # 20% smaller deadzone for alt mode
+        alt_mode_deadzone = self.alt_mode_deadzone
         
         # Determine sector directly without using get_current_sector to avoid extra calculations
         if distance < alt_mode_deadzone:
             new_sector = None
         else:
-            # Direct sector determination for speed
-            for sector_name, sector_range in SECTORS.items():
-                start = sector_range["start"]
-                end = sector_range["end"]
-                
-                # Handle sector that wraps around 0°
-                if start > end:
-                    if angle >= start or angle <= end:
-                        new_sector = sector_name
-                        break
-                else:
-                    if start <= angle <= end:
-                        new_sector = sector_name
-                        break
-            else:
-                new_sector = None
+            # Same angle -> sector lookup as get_current_sector
+            new_sector = lookup_sector(self._sector_lut, SECTORS, angle)
         
-        # Get current joystick position for visualization
-        current_position = self.get_joystick_position()
-        
-        # Update debug info with current position and other alt mode info
-        self.debug_info["position"] = current_position
-        self.debug_info["angle"] = angle
-        self.debug_info["distance"] = distance
-        self.debug_info["alt_mode_active"] = True
-        self.debug_info["alt_mode_sector"] = new_sector
+        # Debug info (position, angle, alt mode sector) is derived by get_debug_info on request
         
         # If in deadzone, release right mouse button and reset sector
         if distance < alt_mode_deadzone:
@@ -1174,20 +1270,8 @@ class ChakramController:
     
     def move_cursor_in_direction(self, sector):
         """Move the cursor in the direction corresponding to the sector."""
-        # Get the cursor offset from config
-        offset = ALT_MODE_CURSOR_OFFSET
-        
-        # Use a lookup table for faster direction determination
-        # This avoids multiple if-else checks
-        direction_map = {
-            "right": (offset, 0),
-            "left": (-offset, 0),
-            "overhead": (0, -offset),
-            "thrust": (0, offset)
-        }
-        
-        # Get direction from map or default to (0,0)
-        dx, dy = direction_map.get(sector, (0, 0))
+        # Get direction from the prebuilt lookup table or default to (0,0)
+        dx, dy = self._cursor_directions.get(sector, (0, 0))
         
         if dx == 0 and dy == 0:
             return  # Unknown sector
@@ -1212,13 +1296,24 @@ class ChakramController:
     
     def update(self):
         """Update the controller state and simulate key presses."""
-        # Get current time
-        current_time = time.time()
+        # Sample the monotonic clock once per tick; everything below reuses it
+        current_time = time.perf_counter()
+        self._tick_time = current_time
         
         # Safety mechanism to prevent infinite loops or getting stuck
         time_since_last_update = current_time - self.last_update_time
         self.last_update_time = current_time
         
+        # Finish a cancel key tap started on an earlier tick once its hold time has passed
+        if self._pending_cancel_release_at is not None and current_time >= self._pending_cancel_release_at:
+            self._pending_cancel_release_at = None
+            self.release_key(self._cancel_key)
+        
+        # Finish a sector change started on an earlier tick once its cancel key has been held long enough
+        pending_sector_finish = self._pending_sector_finish
+        if pending_sector_finish is not None and current_time >= pending_sector_finish[0]:
+            self._finish_sector_change()
+        
         # Check if alt mode key is pressed
         alt_key_pressed = self.check_alt_mode_key()
         
@@ -1227,78 +1322,134 @@ class ChakramController:
             # Alt key just pressed - activate alt mode
             self.alt_mode_active = True
             self.alt_mode_key_pressed = True
-            print("Alternative mode activated")
+            self._log_message("Alternative mode activated")
             
             # Release all keys from standard mode
             self.release_all_keys()
             
             # Reset sector change flag to prevent getting stuck
             self.sector_change_in_progress = False
+            self._pending_sector_finish = None
             
         elif not alt_key_pressed and self.alt_mode_key_pressed:
             # Alt key just released - deactivate alt mode
             self.alt_mode_active = False
             self.alt_mode_key_pressed = False
-            print("Alternative mode deactivated")
+            self._log_message("Alternative mode deactivated")
             
             # Clean up alt mode
             self.exit_alt_mode()
             
-            # Reset sector change flag to prevent getting stuck
-            self.sector_change_in_progress = False
+            # Drop any sector change in flight (letting go of its held cancel key) so it can't get stuck
+            self._abandon_sector_change()
         
-        # Get joystick position, angle, and distance
-        current_position = self.get_joystick_position()
-        angle, distance = self.get_joystick_angle_and_distance()
+        # Get joystick position and distance; compare squared distances first so the
+        # angle (atan2) is only computed when something outside the deadzone needs it.
+        # Read the first button (usually the main/cancel button) once per tick as well
+        try:
+            x, y, distance_sq = self._position_r2()
+            cancel_pressed = self._has_cancel_button and self._get_button(0)
+        except pygame.error as e:
+            # Only a lost joystick makes these reads fail; skip the tick and retry on the next
+            # one, reporting the failure once rather than on every tick
+            if not self._joystick_read_failed:
+                self._joystick_read_failed = True
+                print(f"Error reading joystick: {e}")
+            return
+        
+        if self._joystick_read_failed:
+            self._joystick_read_failed = False
+            print("Joystick reads recovered")
+        
+        # Delta input only: if the stick has not moved beyond sensor noise since the last fully
+        # processed tick and nothing is pending (deadzone release timer, alt mode, cancel button),
+        # the rest of the tick would reach the same result, so skip it
+        if (self._tick_settled and not self.alt_mode_active
+                and abs(x - self._last_x) < STICK_NOISE_EPSILON
+                and abs(y - self._last_y) < STICK_NOISE_EPSILON
+                and not (self.in_deadzone and self._pressed_mask)
+                and not cancel_pressed):
+            # A resting stick has no speed; keep the deadzone exit logic from seeing a stale value
+            if self.in_deadzone:
+                self.deadzone_speed_sq = 0.0
+            # The cancel button is known to be up here, so the next press is a new edge
+            self._cancel_button_down = False
+            self.last_position_time = current_time
+            # Poll less often once the stick has been resting for a while
+            if current_time - self._last_activity_time > IDLE_AFTER:
+                self.suggested_interval = IDLE_POLL_INTERVAL
+            return
+        self._tick_settled = False
+        self._last_activity_time = current_time
+        self.suggested_interval = ACTIVE_POLL_INTERVAL
+        self._last_x = x
+        self._last_y = y
+        
+        current_position = (x, y)
+        distance = min(1.0, math.sqrt(distance_sq))
+        
+        # Resolve the effective deadzone once per tick; get_current_sector reuses it
+        effective_deadzone = self.get_effective_deadzone()
+        self._cached_eff_dz = effective_deadzone
+        self._cached_eff_dz_sq = effective_deadzone * effective_deadzone
+        
+        if distance_sq < min(self._cached_eff_dz_sq, self._alt_mode_deadzone_sq):
+            # Neither sector lookup nor alt mode uses the angle here; keep the last one for display
+            angle = self._last_angle
+        else:
+            angle = self._angle_of(x, y)
+            self._last_angle = angle
         
         # Simplified deadzone detection - use a direct approach
         was_in_deadzone = self.in_deadzone
         
         # Direct deadzone check - no hysteresis or debouncing
         # This makes the deadzone more responsive and predictable
-        self.in_deadzone = distance < DEADZONE
-        
-        # Calculate movement speed for all frames to get more accurate readings
-        movement_speed = self.calculate_movement_speed(
-            self.last_position, current_position, 
-            self.last_position_time, current_time
-        )
+        self.in_deadzone = distance_sq < self._deadzone_sq
         
-        # Store the speed for use in deadzone exit logic
+        # Store the speed for use in deadzone exit logic; it is only read there, so compute it
+        # while in the deadzone and keep it squared (the threshold compare needs no sqrt)
         if self.in_deadzone:
             # Update the speed while in deadzone to get the most recent value
-            self.deadzone_speed = movement_speed
+            last_x, last_y = self.last_position
+            dx = x - last_x
+            dy = y - last_y
+            time_diff = current_time - self.last_position_time
+            self.deadzone_speed_sq = (dx*dx + dy*dy) / (time_diff * time_diff) if time_diff > 0 else 0.0
         
         # SIMPLIFIED DEADZONE LOGIC
-        # If we just entered the deadzone
-        if self.in_deadzone and not was_in_deadzone:
-            self.deadzone_entry_time = current_time
-            print(f"Entered deadzone at {current_time:.3f}")
-            
-            # Store the last active sector before entering deadzone
-            if self.current_sector is not None:
-                self.last_active_sector = self.current_sector
-                print(f"Stored last active sector: {self.last_active_sector}")
-            
-            # Reset sector change flag when entering deadzone
-            self.sector_change_in_progress = False
-        
-        # If we're in the deadzone, check how long we've been there
+        # Test the common case (steady outside the deadzone) first, so it falls through both checks
         if self.in_deadzone:
+            # If we just entered the deadzone
+            if not was_in_deadzone:
+                self.deadzone_entry_time = current_time
+                self._log_message("Entered deadzone at %.3f", current_time)
+                
+                # Store the last active sector before entering deadzone
+                if self.current_sector is not None:
+                    self.last_active_sector = self.current_sector
+                    self._log_message("Stored last active sector: %s", self.last_active_sector)
+                
+                # Reset sector change flag when entering deadzone
+                self.sector_change_in_progress = False
+            
+            # Check how long we've been in the deadzone
             deadzone_time = current_time - self.deadzone_entry_time
             
             # If we've been in the deadzone for longer than the threshold, release attack buttons
-            if deadzone_time >= DEADZONE_TIME_THRESHOLD and len(self.pressed_keys) > 0:
-                print(f"In deadzone for {deadzone_time:.3f}s, releasing all attack keys")
+            # (a cancel tap still being held is left for its own release deadline)
+            if (deadzone_time >= DEADZONE_TIME_THRESHOLD and self._pressed_mask
+                    and self._pending_cancel_release_at is None):
+                self._log_message("In deadzone for %.3fs, releasing all attack keys", deadzone_time)
                 self.release_all_keys()
                 
                 # Update state
                 self.current_sector = None
                 self.current_state = "neutral"
         
-        # If we just exited the deadzone
-        if not self.in_deadzone and was_in_deadzone:
-            print(f"Exited deadzone at {current_time:.3f}")
+        elif was_in_deadzone:
+            # We just exited the deadzone
+            self._log_message("Exited deadzone at %.3f", current_time)
             
             # Reset sector change flag when exiting deadzone
             self.sector_change_in_progress = False
@@ -1311,14 +1462,14 @@ class ChakramController:
             if (new_sector is not None and 
                 self.last_active_sector is not None and 
                 new_sector != self.last_active_sector):
-                print(f"Detected sector change through deadzone: {self.last_active_sector} -> {new_sector}")
+                self._log_message("Detected sector change through deadzone: %s -> %s", self.last_active_sector, new_sector)
                 
                 # Set the sector change flag and update the last change time
                 self.sector_change_in_progress = True
                 self.last_sector_change_time = current_time
                 
                 # Handle the sector change directly
-                self._enqueue_sector_change(self.last_active_sector, new_sector)
+                self._enqueue_sector_change(self.last_active_sector, new_sector, distance)
                 
                 # Update current sector to the new one
                 self.current_sector = new_sector
@@ -1337,27 +1488,12 @@ class ChakramController:
         new_sector = self.get_current_sector(angle, distance)
         new_state = self.get_current_state(new_sector, angle, distance)
         
-        # Determine if this is a quick movement through the deadzone
-        quick_movement = self.deadzone_speed > DEADZONE_SPEED_THRESHOLD
-        
-        # Update debug info
-        self.debug_info["position"] = current_position
-        self.debug_info["angle"] = angle
-        self.debug_info["distance"] = distance
-        self.debug_info["sector"] = new_sector
-        self.debug_info["state"] = new_state
-        self.debug_info["pressed_keys"] = list(self.pressed_keys)
-        self.debug_info["deadzone_speed"] = self.deadzone_speed
-        self.debug_info["quick_movement"] = quick_movement
-        self.debug_info["alt_mode_active"] = self.alt_mode_active
-        self.debug_info["alt_mode_sector"] = self.alt_mode_current_sector
-        
         # Skip processing if a sector change is already in progress
         # But add a timeout to prevent getting stuck
         if self.sector_change_in_progress:
             # Check if we've been stuck for too long
             if time_since_last_update > self.sector_change_timeout:
-                print(f"Sector change taking too long ({time_since_last_update:.3f}s). Forcing reset.")
+                self._log_message("Sector change taking too long (%.3fs). Forcing reset.", time_since_last_update)
                 self.sector_change_in_progress = False
                 # Continue processing this frame instead of returning
             else:
@@ -1368,73 +1504,47 @@ class ChakramController:
         
         # Process state changes and button presses
         state_changed = False
-        cancel_pressed = False
         
-        # Check for cancel button press in any state
-        try:
-            # Check if joystick has buttons
-            if self.joystick and self.joystick.get_numbuttons() > 0:
-                # Check the first button (usually the main/cancel button)
-                if self.joystick.get_button(0):
-                    # Press and release the cancel key
-                    cancel_key = KEY_MAPPINGS["cancel"]
-                    self.press_key(cancel_key)
-                    # Release after a short delay
-                    time.sleep(0.05)
-                    self.release_key(cancel_key)
-                    print("Cancel button pressed")
-                    cancel_pressed = True
-                    
-                    # If we're in an attack state, also release the attack key
-                    if self.current_state == "attack" and self.current_sector:
-                        attack_key = KEY_MAPPINGS[self.current_sector]
-                        if attack_key in self.pressed_keys:
-                            self.release_key(attack_key)
-                            print(f"Released attack key {attack_key} due to cancel button press")
-        except Exception as e:
-            print(f"Error checking cancel button: {e}")
+        # Check for cancel button press in any state (cancel_pressed was read at the start of the tick)
+        if cancel_pressed and not self._cancel_button_down:
+            # Tap the cancel key: press it now, a later tick releases it once the
+            # hold time has passed, so the input loop never sleeps here
+            self.press_key(self._cancel_key)
+            self._pending_cancel_release_at = current_time + CANCEL_HOLD_TIME
+            self._log_message("Cancel button pressed")
+        self._cancel_button_down = cancel_pressed
+        
+        if cancel_pressed:
+            # If we're in an attack state, also release the attack key
+            if self.current_state == "attack" and self.current_sector:
+                attack_key = self._sector_keys[self.current_sector]
+                if self._pressed_mask & _KEY_BITS[attack_key]:
+                    self.release_key(attack_key)
+                    self._log_message("Released attack key %s due to cancel button press", attack_key)
             
         # Handle sector changes (only if we're not in neutral state and cancel wasn't pressed)
         if not cancel_pressed and new_sector != self.current_sector:
             # When crossing sector boundary:
             if self.current_sector is not None and new_sector is not None:
-                # If we've quickly moved through the deadzone, use atomic operation for maximum speed
-                if quick_movement and was_in_deadzone:
-                    print(f"Quick movement through deadzone detected (speed: {self.deadzone_speed:.2f}). Using atomic operation.")
+                # If we've quickly moved through the deadzone, use atomic operation for maximum speed.
+                # The speed is only checked here, once a boundary was actually crossed, and after the
+                # cheaper was_in_deadzone test that is false for most crossings
+                if was_in_deadzone and self.deadzone_speed_sq > DEADZONE_SPEED_THRESHOLD_SQ:
+                    self._log_message("Quick movement through deadzone detected (speed: %.2f). Using batched sector change.", math.sqrt(self.deadzone_speed_sq))
                     
                     try:
-                        # Import the optimized function for sending sector change
-                        from src.win_input import send_sector_change
-                        
-                        cancel_key = KEY_MAPPINGS["cancel"]
-                        old_attack_key = KEY_MAPPINGS[self.current_sector]
-                        new_attack_key = KEY_MAPPINGS[new_sector]
-                        
-                        # Use the optimized sector change function that ensures correct key sequence:
-                        # 1. Press cancel key
-                        # 2. Release old attack key
-                        # 3. Release cancel key
-                        # 4. Press new attack key
-                        send_sector_change(cancel_key, old_attack_key, new_attack_key, 0)
-                        
-                        # Update the pressed keys set
-                        if old_attack_key in self.pressed_keys:
-                            self.pressed_keys.remove(old_attack_key)
-                            self._log_key_action(old_attack_key, True, batch=True)
-                        
-                        self.pressed_keys.add(new_attack_key)
-                        self._log_key_action(cancel_key, False, batch=True)
-                        self._log_key_action(cancel_key, True, batch=True)
-                        self._log_key_action(new_attack_key, False, batch=True)
+                        # Press cancel and release the old attack key now; a later tick releases
+                        # cancel and presses the new attack key once the cancel hold has passed
+                        self._start_sector_change(self.current_sector, new_sector)
                     except Exception as e:
                         print(f"Error during quick movement handling: {e}")
+                        self.sector_change_in_progress = False
                         # Fallback to individual key operations if the atomic operation fails
-                        if self.current_sector and KEY_MAPPINGS[self.current_sector] in self.pressed_keys:
-                            self.release_key(KEY_MAPPINGS[self.current_sector])
+                        old_attack_key = self._sector_keys[self.current_sector]
+                        if self._pressed_mask & _KEY_BITS[old_attack_key]:
+                            self.release_key(old_attack_key)
                         
-                        if new_sector:
-                            new_attack_key = KEY_MAPPINGS[new_sector]
-                            self.press_key(new_attack_key)
+                        self.press_key(self._sector_keys[new_sector])
                     
                     # Skip the cooldown period for quick movements
                     self.last_sector_change_time = 0
@@ -1442,19 +1552,19 @@ class ChakramController:
                     # Set the sector change flag and update the last change time
                     self.sector_change_in_progress = True
                     self.last_sector_change_time = current_time
-                    print(f"Starting sector change: {self.current_sector} -> {new_sector}")
+                    self._log_message("Starting sector change: %s -> %s", self.current_sector, new_sector)
                     # Handle the sector change directly
-                    self._enqueue_sector_change(self.current_sector, new_sector)
+                    self._enqueue_sector_change(self.current_sector, new_sector, distance)
             elif new_state == "attack" and new_sector:
                 # If we're entering a sector from neutral, just press the attack key
-                new_attack_key = KEY_MAPPINGS[new_sector]
+                new_attack_key = self._sector_keys[new_sector]
                 self.press_key(new_attack_key)
         
         # Handle state changes within the same sector
         elif new_state != self.current_state:
             if new_state == "attack" and new_sector:
                 # If we're entering attack state in the same sector, press the attack key
-                new_attack_key = KEY_MAPPINGS[new_sector]
+                new_attack_key = self._sector_keys[new_sector]
                 self.press_key(new_attack_key)
         
         self.current_sector = new_sector
@@ -1463,78 +1573,121 @@ class ChakramController:
         # Update tracking variables for next iteration
         self.last_position = current_position
         self.last_position_time = current_time
+        
+        # Everything for this position has been handled; identical ticks can be skipped
+        self._tick_settled = not self.sector_change_in_progress
     
-    def _enqueue_key_event(self, key, is_up, delay=0):
-        """Add a key event to the queue with an optional delay."""
-        self.key_event_queue.put((key, is_up, delay))
-    
-    def _enqueue_sector_change(self, old_sector, new_sector):
+    def _enqueue_sector_change(self, old_sector, new_sector, distance):
         """
-        Execute a direct sector change with maximum performance.
-        This is a highly optimized version that skips all queuing and directly sends inputs.
+        Start a sector change without blocking the input loop.
+        The new attack key is pressed by a later tick once the cancel hold has passed.
+        distance is the joystick distance the caller read on this tick.
         """
-        cancel_key = KEY_MAPPINGS["cancel"]
-        old_attack_key = KEY_MAPPINGS[old_sector]
-        new_attack_key = KEY_MAPPINGS[new_sector]
+        old_attack_key = self._sector_keys[old_sector]
         
         # First, check if we're still in a valid state to perform the sector change
         # This prevents issues when the joystick has moved back to deadzone during processing
-        current_position = self.get_joystick_position()
-        angle, distance = self.get_joystick_angle_and_distance()
-        
         # If we've moved back to deadzone, cancel the sector change
         if distance < DEADZONE:
-            print("Canceling sector change - returned to deadzone")
+            self._log_message("Canceling sector change - returned to deadzone")
             self.sector_change_in_progress = False
             
             # Release any pressed keys
-            if old_attack_key in self.pressed_keys:
+            if self._pressed_mask & _KEY_BITS[old_attack_key]:
                 self.release_key(old_attack_key)
             
             return
         
         try:
-            # SIMPLIFIED APPROACH: Use individual key operations for maximum reliability
-            # This is more reliable than the atomic operation in some cases
-            
-            # 1. Press cancel key
-            self.press_key(cancel_key)
-            
-            # 2. Release old attack key
-            if old_attack_key in self.pressed_keys:
-                self.release_key(old_attack_key)
-            
-            # 3. Release cancel key (after a very short delay)
-            time.sleep(0.01)  # 10ms delay
-            self.release_key(cancel_key)
-            
-            # 4. Press new attack key
-            self.press_key(new_attack_key)
-            
-            # Immediately mark the sector change as complete
-            self.sector_change_in_progress = False
-            print(f"Sector change completed: {old_sector} -> {new_sector}")
+            self._start_sector_change(old_sector, new_sector)
         except Exception as e:
             print(f"Error during sector change: {e}")
             # Reset the sector change flag to prevent getting stuck
             self.sector_change_in_progress = False
             
             # Fallback to individual key operations if the atomic operation fails
-            if old_attack_key in self.pressed_keys:
+            if self._pressed_mask & _KEY_BITS[old_attack_key]:
                 self.release_key(old_attack_key)
             
-            # Only press the new attack key if we're still outside the deadzone
-            if distance >= DEADZONE:
-                self.press_key(new_attack_key)
+            self.press_key(self._sector_keys[new_sector])
+    
+    def _start_sector_change(self, old_sector, new_sector):
+        """
+        Press the cancel key and release the old attack key in one batched input call.
+        The cancel key stays held for SECTOR_CHANGE_CANCEL_HOLD; update() then calls
+        _finish_sector_change on a later tick, so the input loop never sleeps for the hold.
+        Raises RuntimeError if the input could not be sent.
+        """
+        cancel_key = self._cancel_key
+        old_attack_key = self._sector_keys[old_sector]
+        if not begin_sector_change(cancel_key, old_attack_key):
+            raise RuntimeError("sector change input was not sent")
+        
+        old_attack_bit = _KEY_BITS[old_attack_key]
+        old_attack_was_pressed = self._pressed_mask & old_attack_bit
+        self._pressed_mask = (self._pressed_mask & ~old_attack_bit) | _KEY_BITS[cancel_key]
+        if self._verbose:
+            self._log_key_action(cancel_key, False, batch=True)
+            if old_attack_was_pressed:
+                self._log_key_action(old_attack_key, True, batch=True)
+        
+        # Sector processing stays paused until the new attack key has been pressed
+        self.sector_change_in_progress = True
+        self._pending_sector_finish = (self._tick_time + SECTOR_CHANGE_CANCEL_HOLD, old_sector, new_sector)
+    
+    def _finish_sector_change(self):
+        """
+        Complete the sector change started by _start_sector_change: release the cancel key
+        and press the new attack key in one batched input call.
+        """
+        _, old_sector, new_sector = self._pending_sector_finish
+        self._pending_sector_finish = None
+        self.sector_change_in_progress = False
+        
+        cancel_key = self._cancel_key
+        cancel_bit = _KEY_BITS[cancel_key]
+        
+        # The stick went back to the deadzone during the hold, or alt mode (where attack keys are
+        # never pressed) is active; only let go of the cancel key
+        if self.in_deadzone or self.alt_mode_active:
+            if self.in_deadzone:
+                self._log_message("Canceling sector change - returned to deadzone")
+            if self._pressed_mask & cancel_bit:
+                self.release_key(cancel_key)
+            return
+        
+        new_attack_key = self._sector_keys[new_sector]
+        try:
+            if not finish_sector_change(cancel_key, new_attack_key):
+                raise RuntimeError("sector change input was not sent")
+            
+            self._pressed_mask = (self._pressed_mask & ~cancel_bit) | _KEY_BITS[new_attack_key]
+            if self._verbose:
+                self._log_key_action(cancel_key, True, batch=True)
+                self._log_key_action(new_attack_key, False, batch=True)
+            self._log_message("Sector change completed: %s -> %s", old_sector, new_sector)
+        except Exception as e:
+            print(f"Error during sector change: {e}")
+            # Fallback to individual key operations if the atomic operation fails
+            self.release_key(cancel_key)
+            self.press_key(new_attack_key)
+    
+    def _abandon_sector_change(self):
+        """Drop the sector change started by _start_sector_change and release its held cancel key."""
+        had_pending = self._pending_sector_finish is not None
+        self._pending_sector_finish = None
+        self.sector_change_in_progress = False
+        if had_pending:
+            self.release_key(self._cancel_key)
     
     def check_alt_mode_key(self):
         """Check if the alt mode key is pressed."""
+        if self._alt_mode_vk is None:
+            return False
+        
         try:
-            # Import the optimized function for checking key state
-            from src.win_input import is_key_pressed
-            
-            # Check if the alt mode key is pressed
-            return is_key_pressed(ALT_MODE_KEY)
+            # Query the key state directly; the highest bit is set while the key is down
+            return (GetAsyncKeyState(self._alt_mode_vk) & 0x8000) != 0
         except Exception as e:
             print(f"Error checking alt mode key: {e}")
             return False
@@ -1545,7 +1698,7 @@ class ChakramController:
             print("Controller is already running")
             return
         
-        self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._background_thread)
         self.thread.daemon = True
         self.thread.start()
@@ -1554,7 +1707,7 @@ class ChakramController:
     
     def stop(self):
         """Stop the controller."""
-        self.running = False
+        self._stop_event.set()
         
         if self.thread is not None:
             self.thread.join(timeout=1.0)
@@ -1573,15 +1726,40 @@ class ChakramController:
         """Background thread for processing joystick input."""
         print("Background thread started")
         
-        while self.running:
-            # Process events to get fresh joystick data
-            pygame.event.pump()
-            
-            # Update controller state
-            self.update()
-            
-            # Sleep to reduce CPU usage
-            time.sleep(0.01)  # 10ms sleep for ~100Hz update rate
+        # Keep the input loop from being preempted, and make the short sleeps actually end on time
+        # instead of being rounded up to the default ~15.6ms Windows timer tick
+        raise_thread_priority()
+        timer_resolution_set = begin_timer_resolution()
+        
+        try:
+            # Ticks are scheduled against a deadline, so the time update() itself takes
+            # is absorbed instead of being added on top of every sleep
+            next_tick = time.perf_counter()
+            stop_event = self._stop_event
+            while not stop_event.is_set():
+                # Process events to get fresh joystick data
+                pygame.event.pump()
+                
+                # get_axis()/get_button() already reflect the newest sample after the pump, so the
+                # queued joystick events collapse to that state; drain them all in one call
+                pygame.event.clear(JOYSTICK_EVENT_TYPES, pump=False)
+                
+                # Update controller state
+                self.update()
+                
+                # Sleep until the next deadline to reduce CPU usage; update() shortens the
+                # interval while the stick is in use
+                next_tick += self.suggested_interval
+                sleep_for = next_tick - time.perf_counter()
+                if sleep_for > 0:
+                    # Returns early as soon as stop() sets the event
+                    stop_event.wait(sleep_for)
+                else:
+                    # Running late: start again from now rather than firing a burst of catch-up ticks
+                    next_tick = time.perf_counter()
+        finally:
+            if timer_resolution_set:
+                end_timer_resolution()
         
         print("Background thread stopped")
     
@@ -1595,4 +1773,30 @@ class ChakramController:
     
     def get_debug_info(self):
         """Get the current debug info."""
+        # update() does not touch debug_info; the fields are filled in place from the controller
+        # state only when the display asks for them, so the dict never resizes
+        debug_info = self.debug_info
+        x = self._last_x
+        y = self._last_y
+        debug_info["position"] = (x, y)
+        debug_info["angle"] = self._last_angle
+        debug_info["distance"] = min(1.0, math.hypot(x, y))
+        debug_info["sector"] = self.current_sector
+        debug_info["state"] = self.current_state
+        debug_info["deadzone_speed"] = math.sqrt(self.deadzone_speed_sq)
+        debug_info["quick_movement"] = self.deadzone_speed_sq > DEADZONE_SPEED_THRESHOLD_SQ
+        debug_info["alt_mode_active"] = self.alt_mode_active
+        debug_info["alt_mode_sector"] = self.alt_mode_current_sector
+        
+        # The pressed key list is decoded from the mask only when the display asks for it,
+        # and only when the mask changed since the last request
+        pressed_mask = self._pressed_mask
+        if pressed_mask != self._debug_pressed_mask:
+            self._debug_pressed_mask = pressed_mask
+            self.debug_info["pressed_keys"] = self._keys_in_mask(pressed_mask)
+        
+        # Diagnostics derived from the movement analyzer are only computed on request, not every tick
+        if self.adaptive_enabled:
+            self.debug_info["movement_speed"] = self.movement_analyzer.current_speed
+            self.debug_info["transition_smoothness"] = self.get_transition_smoothness()
         return self.debug_info
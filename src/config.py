@@ -99,9 +99,59 @@ DEFAULT_VISUALIZATION = {
     }
 }
 
-# Try to load the user's configuration
+# Default configuration, keyed by the setting names used in the user's config file
+DEFAULT_CONFIG = {
+    "deadzone": DEFAULT_DEADZONE,
+    "deadzone_time_threshold": DEFAULT_DEADZONE_TIME_THRESHOLD,
+    "deadzone_speed_threshold": DEFAULT_DEADZONE_SPEED_THRESHOLD,
+    "release_delay": DEFAULT_RELEASE_DELAY,
+    "sector_change_cooldown": DEFAULT_SECTOR_CHANGE_COOLDOWN,
+    "alt_mode_key": DEFAULT_ALT_MODE_KEY,
+    "alt_mode_cursor_offset": DEFAULT_ALT_MODE_CURSOR_OFFSET,
+    "sectors": DEFAULT_SECTORS,
+    "key_mappings": DEFAULT_KEY_MAPPINGS,
+    "visualization": DEFAULT_VISUALIZATION,
+    
+    # Adaptive control system settings
+    "adaptive_enabled": DEFAULT_ADAPTIVE_ENABLED,
+    
+    # Dynamic deadzone settings
+    "dynamic_deadzone_enabled": DEFAULT_DYNAMIC_DEADZONE_ENABLED,
+    "dynamic_deadzone_min_factor": DEFAULT_DYNAMIC_DEADZONE_MIN_FACTOR,
+    "dynamic_deadzone_max_factor": DEFAULT_DYNAMIC_DEADZONE_MAX_FACTOR,
+    
+    # Movement prediction settings
+    "prediction_enabled": DEFAULT_PREDICTION_ENABLED,
+    "prediction_time": DEFAULT_PREDICTION_TIME,
+    "prediction_confidence_threshold": DEFAULT_PREDICTION_CONFIDENCE_THRESHOLD,
+    
+    # Transition smoothness settings
+    "transition_smoothness": DEFAULT_TRANSITION_SMOOTHNESS,
+    "transition_min_factor": DEFAULT_TRANSITION_MIN_FACTOR,
+    "transition_max_factor": DEFAULT_TRANSITION_MAX_FACTOR,
+    
+    # Combat mode settings
+    "combat_mode_enabled": DEFAULT_COMBAT_MODE_ENABLED,
+    "combat_mode_key": DEFAULT_COMBAT_MODE_KEY,
+    "combat_mode_deadzone": DEFAULT_COMBAT_MODE_DEADZONE,
+    "combat_mode_transition_smoothness": DEFAULT_COMBAT_MODE_TRANSITION_SMOOTHNESS,
+    
+    # Game state detection settings
+    "game_state_detection_enabled": DEFAULT_GAME_STATE_DETECTION_ENABLED,
+    "combat_timeout": DEFAULT_COMBAT_TIMEOUT
+}
+
+# Numeric settings are converted to their default's type once at load time,
+# so the controller never sees a string or int where it expects a float
+NUMERIC_SETTINGS = {
+    key: type(value) for key, value in DEFAULT_CONFIG.items() if type(value) in (int, float)
+}
+
 def load_user_config():
-    """Load the user's configuration from the config file."""
+    """Load the user's configuration from the config file, on top of the defaults."""
+    config = dict(DEFAULT_CONFIG)
+    
+    # Try to load the user's configuration
     config_dir = os.path.join(os.path.expanduser("~"), ".chakram_controller")
     config_path = os.path.join(config_dir, "config.json")
     
@@ -110,129 +160,70 @@ def load_user_config():
             with open(config_path, "r") as f:
                 user_config = json.load(f)
             
-            # Return the user's configuration
-            return {
-                "deadzone": user_config.get("deadzone", DEFAULT_DEADZONE),
-                "deadzone_time_threshold": user_config.get("deadzone_time_threshold", DEFAULT_DEADZONE_TIME_THRESHOLD),
-                "deadzone_speed_threshold": user_config.get("deadzone_speed_threshold", DEFAULT_DEADZONE_SPEED_THRESHOLD),
-                "release_delay": user_config.get("release_delay", DEFAULT_RELEASE_DELAY),
-                "sector_change_cooldown": user_config.get("sector_change_cooldown", DEFAULT_SECTOR_CHANGE_COOLDOWN),
-                "alt_mode_key": user_config.get("alt_mode_key", DEFAULT_ALT_MODE_KEY),
-                "alt_mode_cursor_offset": user_config.get("alt_mode_cursor_offset", DEFAULT_ALT_MODE_CURSOR_OFFSET),
-                "sectors": user_config.get("sectors", DEFAULT_SECTORS),
-                "key_mappings": user_config.get("key_mappings", DEFAULT_KEY_MAPPINGS),
-                "visualization": user_config.get("visualization", DEFAULT_VISUALIZATION),
-                
-                # Adaptive control system settings
-                "adaptive_enabled": user_config.get("adaptive_enabled", DEFAULT_ADAPTIVE_ENABLED),
-                
-                # Dynamic deadzone settings
-                "dynamic_deadzone_enabled": user_config.get("dynamic_deadzone_enabled", DEFAULT_DYNAMIC_DEADZONE_ENABLED),
-                "dynamic_deadzone_min_factor": user_config.get("dynamic_deadzone_min_factor", DEFAULT_DYNAMIC_DEADZONE_MIN_FACTOR),
-                "dynamic_deadzone_max_factor": user_config.get("dynamic_deadzone_max_factor", DEFAULT_DYNAMIC_DEADZONE_MAX_FACTOR),
-                
-                # Movement prediction settings
-                "prediction_enabled": user_config.get("prediction_enabled", DEFAULT_PREDICTION_ENABLED),
-                "prediction_time": user_config.get("prediction_time", DEFAULT_PREDICTION_TIME),
-                "prediction_confidence_threshold": user_config.get("prediction_confidence_threshold", DEFAULT_PREDICTION_CONFIDENCE_THRESHOLD),
-                
-                # Transition smoothness settings
-                "transition_smoothness": user_config.get("transition_smoothness", DEFAULT_TRANSITION_SMOOTHNESS),
-                "transition_min_factor": user_config.get("transition_min_factor", DEFAULT_TRANSITION_MIN_FACTOR),
-                "transition_max_factor": user_config.get("transition_max_factor", DEFAULT_TRANSITION_MAX_FACTOR),
-                
-                # Combat mode settings
-                "combat_mode_enabled": user_config.get("combat_mode_enabled", DEFAULT_COMBAT_MODE_ENABLED),
-                "combat_mode_key": user_config.get("combat_mode_key", DEFAULT_COMBAT_MODE_KEY),
-                "combat_mode_deadzone": user_config.get("combat_mode_deadzone", DEFAULT_COMBAT_MODE_DEADZONE),
-                "combat_mode_transition_smoothness": user_config.get("combat_mode_transition_smoothness", DEFAULT_COMBAT_MODE_TRANSITION_SMOOTHNESS),
-                
-                # Game state detection settings
-                "game_state_detection_enabled": user_config.get("game_state_detection_enabled", DEFAULT_GAME_STATE_DETECTION_ENABLED),
-                "combat_timeout": user_config.get("combat_timeout", DEFAULT_COMBAT_TIMEOUT)
-            }
+            # Only known settings override the defaults
+            for key, value in user_config.items():
+                if key in config:
+                    config[key] = value
         except Exception as e:
             print(f"Error loading user configuration: {e}")
     
-    # Return the default configuration if the user's configuration couldn't be loaded
-    return {
-        "deadzone": DEFAULT_DEADZONE,
-        "deadzone_time_threshold": DEFAULT_DEADZONE_TIME_THRESHOLD,
-        "deadzone_speed_threshold": DEFAULT_DEADZONE_SPEED_THRESHOLD,
-        "release_delay": DEFAULT_RELEASE_DELAY,
-        "sector_change_cooldown": DEFAULT_SECTOR_CHANGE_COOLDOWN,
-        "sectors": DEFAULT_SECTORS,
-        "key_mappings": DEFAULT_KEY_MAPPINGS,
-        "visualization": DEFAULT_VISUALIZATION,
-        
-        # Adaptive control system settings
-        "adaptive_enabled": DEFAULT_ADAPTIVE_ENABLED,
-        
-        # Dynamic deadzone settings
-        "dynamic_deadzone_enabled": DEFAULT_DYNAMIC_DEADZONE_ENABLED,
-        "dynamic_deadzone_min_factor": DEFAULT_DYNAMIC_DEADZONE_MIN_FACTOR,
-        "dynamic_deadzone_max_factor": DEFAULT_DYNAMIC_DEADZONE_MAX_FACTOR,
-        
-        # Movement prediction settings
-        "prediction_enabled": DEFAULT_PREDICTION_ENABLED,
-        "prediction_time": DEFAULT_PREDICTION_TIME,
-        "prediction_confidence_threshold": DEFAULT_PREDICTION_CONFIDENCE_THRESHOLD,
-        
-        # Transition smoothness settings
-        "transition_smoothness": DEFAULT_TRANSITION_SMOOTHNESS,
-        "transition_min_factor": DEFAULT_TRANSITION_MIN_FACTOR,
-        "transition_max_factor": DEFAULT_TRANSITION_MAX_FACTOR,
-        
-        # Combat mode settings
-        "combat_mode_enabled": DEFAULT_COMBAT_MODE_ENABLED,
-        "combat_mode_key": DEFAULT_COMBAT_MODE_KEY,
-        "combat_mode_deadzone": DEFAULT_COMBAT_MODE_DEADZONE,
-        "combat_mode_transition_smoothness": DEFAULT_COMBAT_MODE_TRANSITION_SMOOTHNESS,
-        
-        # Game state detection settings
-        "game_state_detection_enabled": DEFAULT_GAME_STATE_DETECTION_ENABLED,
-        "combat_timeout": DEFAULT_COMBAT_TIMEOUT
-    }
+    # Validate the numeric settings
+    for key, value_type in NUMERIC_SETTINGS.items():
+        value = config[key]
+        try:
+            # JSON true/false would otherwise pass as 1/0
+            if isinstance(value, bool):
+                raise TypeError(f"{key} must be a number")
+            converted = value_type(value)
+            # int() silently truncates, so a fractional value for an int setting is rejected
+            if value_type is int and converted != float(value):
+                raise ValueError(f"{key} must be a whole number")
+            config[key] = converted
+        except (TypeError, ValueError, OverflowError):
+            print(f"Invalid value for {key}: {config[key]!r}, using default {DEFAULT_CONFIG[key]}")
+            config[key] = DEFAULT_CONFIG[key]
+    
+    return config
 
 # Load the user's configuration
 user_config = load_user_config()
 
 # Set the configuration values
 DEADZONE = user_config["deadzone"]
-DEADZONE_TIME_THRESHOLD = user_config.get("deadzone_time_threshold", DEFAULT_DEADZONE_TIME_THRESHOLD)
-DEADZONE_SPEED_THRESHOLD = user_config.get("deadzone_speed_threshold", DEFAULT_DEADZONE_SPEED_THRESHOLD)
+DEADZONE_TIME_THRESHOLD = user_config["deadzone_time_threshold"]
+DEADZONE_SPEED_THRESHOLD = user_config["deadzone_speed_threshold"]
 RELEASE_DELAY = user_config["release_delay"]
-SECTOR_CHANGE_COOLDOWN = user_config.get("sector_change_cooldown", DEFAULT_SECTOR_CHANGE_COOLDOWN)
-ALT_MODE_KEY = user_config.get("alt_mode_key", DEFAULT_ALT_MODE_KEY)
-ALT_MODE_CURSOR_OFFSET = user_config.get("alt_mode_cursor_offset", DEFAULT_ALT_MODE_CURSOR_OFFSET)
+SECTOR_CHANGE_COOLDOWN = user_config["sector_change_cooldown"]
+ALT_MODE_KEY = user_config["alt_mode_key"]
+ALT_MODE_CURSOR_OFFSET = user_config["alt_mode_cursor_offset"]
 SECTORS = user_config["sectors"]
 KEY_MAPPINGS = user_config["key_mappings"]
 VISUALIZATION = user_config["visualization"]
 
 # Adaptive control system settings
-ADAPTIVE_ENABLED = user_config.get("adaptive_enabled", DEFAULT_ADAPTIVE_ENABLED)
+ADAPTIVE_ENABLED = user_config["adaptive_enabled"]
 
 # Dynamic deadzone settings
-DYNAMIC_DEADZONE_ENABLED = user_config.get("dynamic_deadzone_enabled", DEFAULT_DYNAMIC_DEADZONE_ENABLED)
-DYNAMIC_DEADZONE_MIN_FACTOR = user_config.get("dynamic_deadzone_min_factor", DEFAULT_DYNAMIC_DEADZONE_MIN_FACTOR)
-DYNAMIC_DEADZONE_MAX_FACTOR = user_config.get("dynamic_deadzone_max_factor", DEFAULT_DYNAMIC_DEADZONE_MAX_FACTOR)
+DYNAMIC_DEADZONE_ENABLED = user_config["dynamic_deadzone_enabled"]
+DYNAMIC_DEADZONE_MIN_FACTOR = user_config["dynamic_deadzone_min_factor"]
+DYNAMIC_DEADZONE_MAX_FACTOR = user_config["dynamic_deadzone_max_factor"]
 
 # Movement prediction settings
-PREDICTION_ENABLED = user_config.get("prediction_enabled", DEFAULT_PREDICTION_ENABLED)
-PREDICTION_TIME = user_config.get("prediction_time", DEFAULT_PREDICTION_TIME)
-PREDICTION_CONFIDENCE_THRESHOLD = user_config.get("prediction_confidence_threshold", DEFAULT_PREDICTION_CONFIDENCE_THRESHOLD)
+PREDICTION_ENABLED = user_config["prediction_enabled"]
+PREDICTION_TIME = user_config["prediction_time"]
+PREDICTION_CONFIDENCE_THRESHOLD = user_config["prediction_confidence_threshold"]
 
 # Transition smoothness settings
-TRANSITION_SMOOTHNESS = user_config.get("transition_smoothness", DEFAULT_TRANSITION_SMOOTHNESS)
-TRANSITION_MIN_FACTOR = user_config.get("transition_min_factor", DEFAULT_TRANSITION_MIN_FACTOR)
-TRANSITION_MAX_FACTOR = user_config.get("transition_max_factor", DEFAULT_TRANSITION_MAX_FACTOR)
+TRANSITION_SMOOTHNESS = user_config["transition_smoothness"]
+TRANSITION_MIN_FACTOR = user_config["transition_min_factor"]
+TRANSITION_MAX_FACTOR = user_config["transition_max_factor"]
 
 # Combat mode settings
-COMBAT_MODE_ENABLED = user_config.get("combat_mode_enabled", DEFAULT_COMBAT_MODE_ENABLED)
-COMBAT_MODE_KEY = user_config.get("combat_mode_key", DEFAULT_COMBAT_MODE_KEY)
-COMBAT_MODE_DEADZONE = user_config.get("combat_mode_deadzone", DEFAULT_COMBAT_MODE_DEADZONE)
-COMBAT_MODE_TRANSITION_SMOOTHNESS = user_config.get("combat_mode_transition_smoothness", DEFAULT_COMBAT_MODE_TRANSITION_SMOOTHNESS)
+COMBAT_MODE_ENABLED = user_config["combat_mode_enabled"]
+COMBAT_MODE_KEY = user_config["combat_mode_key"]
+COMBAT_MODE_DEADZONE = user_config["combat_mode_deadzone"]
+COMBAT_MODE_TRANSITION_SMOOTHNESS = user_config["combat_mode_transition_smoothness"]
 
 # Game state detection settings
-GAME_STATE_DETECTION_ENABLED = user_config.get("game_state_detection_enabled", DEFAULT_GAME_STATE_DETECTION_ENABLED)
-COMBAT_TIMEOUT = user_config.get("combat_timeout", DEFAULT_COMBAT_TIMEOUT)
+GAME_STATE_DETECTION_ENABLED = user_config["game_state_detection_enabled"]
+COMBAT_TIMEOUT = user_config["combat_timeout"]
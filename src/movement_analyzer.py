@@ -6,6 +6,7 @@ Analyzes joystick movement patterns to enable smart transitions.
 import math
 import time
 from collections import deque
+from src.sectors import scan_sector
 
 class MovementAnalyzer:
     """
@@ -14,12 +15,14 @@ class MovementAnalyzer:
     and predicts future movements.
     """
     
-    def __init__(self, history_size=10):
+    def __init__(self, history_size=10, smoothing_alpha=0.5):
         """
         Initialize the movement analyzer.
         
         Args:
             history_size (int): Number of historical positions to keep
+            smoothing_alpha (float): Smoothing factor for the double exponential
+                smoothing used to predict future positions (0.0 to 1.0)
         """
         self.position_history = deque(maxlen=history_size)
         self.velocity_history = deque(maxlen=history_size)
@@ -32,6 +35,12 @@ class MovementAnalyzer:
         self.current_acceleration = (0, 0)
         self.current_direction = 0  # in degrees
         
+        # Double exponential smoothing (Brown's method) state for O(1) prediction
+        self.smoothing_alpha = smoothing_alpha
+        self.smoothed_position = None  # First-order smoothed position (x, y)
+        self.double_smoothed_position = None  # Second-order smoothed position (x, y)
+        self.last_dt = 0.0  # Time between the two most recent updates
+        
         # Prediction
         self.predicted_position = None
         self.predicted_sector = None
@@ -52,6 +61,9 @@ class MovementAnalyzer:
         self.position_history.append(position)
         self.timestamp_history.append(timestamp)
         
+        # Update the smoothed positions used for prediction
+        self._update_smoothing(position)
+        
         # Calculate velocity if we have at least 2 positions
         if len(self.position_history) >= 2:
             prev_pos = self.position_history[-2]
@@ -60,6 +72,8 @@ class MovementAnalyzer:
             # Time difference in seconds
             dt = timestamp - prev_time
             if dt > 0:
+                self.last_dt = dt
+                
                 # Calculate velocity (units per second)
                 dx = position[0] - prev_pos[0]
                 dy = position[1] - prev_pos[1]
@@ -72,7 +86,7 @@ class MovementAnalyzer:
                 self.current_velocity = velocity
                 
                 # Calculate speed (magnitude of velocity)
-                self.current_speed = math.sqrt(velocity[0]**2 + velocity[1]**2)
+                self.current_speed = math.hypot(velocity[0], velocity[1])
                 
                 # Calculate direction (in degrees, 0° is right, 90° is down)
                 self.current_direction = math.degrees(math.atan2(velocity[1], velocity[0]))
@@ -107,25 +121,63 @@ class MovementAnalyzer:
             "prediction_confidence": self.prediction_confidence
         }
     
+    def trail_view(self):
+        """
+        Get a live, zero-copy view of the recent position history for trail visualization.
+        
+        The returned deque keeps updating as positions are added. Readers on another
+        thread should snapshot it with a single list() call rather than iterating it directly.
+        
+        Returns:
+            deque: Recent joystick positions, oldest first
+        """
+        return self.position_history
+    
+    def _update_smoothing(self, position):
+        """
+        Update the double exponential smoothing state with a new position.
+        
+        Args:
+            position (tuple): Current joystick position as (x, y)
+        """
+        if self.smoothed_position is None:
+            self.smoothed_position = position
+            self.double_smoothed_position = position
+            return
+        
+        alpha = self.smoothing_alpha
+        sx, sy = self.smoothed_position
+        s2x, s2y = self.double_smoothed_position
+        
+        sx = alpha * position[0] + (1 - alpha) * sx
+        sy = alpha * position[1] + (1 - alpha) * sy
+        self.smoothed_position = (sx, sy)
+        self.double_smoothed_position = (alpha * sx + (1 - alpha) * s2x,
+                                         alpha * sy + (1 - alpha) * s2y)
+    
     def _predict_movement(self, prediction_time=0.1):
         """
         Predict future joystick position based on current movement.
+        Uses the double exponential smoothing state, so the cost is constant
+        regardless of the history size.
         
         Args:
             prediction_time (float): Time in the future to predict (seconds)
         """
-        if len(self.position_history) < 2 or len(self.velocity_history) < 1:
+        if (len(self.position_history) < 2 or len(self.velocity_history) < 1
+                or self.last_dt <= 0 or self.smoothing_alpha >= 1.0):
             self.predicted_position = None
             self.predicted_sector = None
             self.prediction_confidence = 0.0
             return
         
-        # Get current position and velocity
-        current_pos = self.position_history[-1]
-        
-        # Simple linear prediction based on velocity
-        pred_x = current_pos[0] + self.current_velocity[0] * prediction_time
-        pred_y = current_pos[1] + self.current_velocity[1] * prediction_time
+        # Brown's forecast m steps ahead: (2 + c) * S - (1 + c) * S2 with c = alpha * m / (1 - alpha)
+        steps_ahead = prediction_time / self.last_dt
+        c = self.smoothing_alpha * steps_ahead / (1 - self.smoothing_alpha)
+        sx, sy = self.smoothed_position
+        s2x, s2y = self.double_smoothed_position
+        pred_x = (2 + c) * sx - (1 + c) * s2x
+        pred_y = (2 + c) * sy - (1 + c) * s2y
         
         # Clamp predicted position to valid joystick range (-1 to 1)
         pred_x = max(-1.0, min(1.0, pred_x))
@@ -168,21 +220,10 @@ class MovementAnalyzer:
             return None
             
         # Determine which sector the predicted position is in
-        for sector_name, sector_range in sectors.items():
-            start = sector_range["start"]
-            end = sector_range["end"]
-            
-            # Handle sector that wraps around 0°
-            if start > end:
-                if angle >= start or angle <= end:
-                    self.predicted_sector = sector_name
-                    return sector_name
-            else:
-                if start <= angle <= end:
-                    self.predicted_sector = sector_name
-                    return sector_name
-                    
-        return None
+        sector_name = scan_sector(sectors, angle)
+        if sector_name is not None:
+            self.predicted_sector = sector_name
+        return sector_name
     
     def get_dynamic_deadzone(self, base_deadzone, min_factor=0.8, max_factor=1.5):
         """
@@ -460,7 +460,7 @@ class ChakramController:
                         # 2. Release old attack key
                         # 3. Release cancel key
                         # 4. Press new attack key
-                        send_sector_change(cancel_key, old_attack_key, new_attack_key, 0)
+                        send_sector_change(cancel_key, old_attack_key, new_attack_key)
                         
                         # Update the pressed keys set
                         if old_attack_key in self.pressed_keys:
@@ -524,7 +524,7 @@ class ChakramController:
         try:
             # Use the Windows API to send a precise sector change sequence
             # This is now a direct, atomic operation with no delays
-            send_sector_change(cancel_key, old_attack_key, new_attack_key, 0)
+            send_sector_change(cancel_key, old_attack_key, new_attack_key)
             
             # Update the pressed keys set
             if old_attack_key in self.pressed_keys:
@@ -0,0 +1,54 @@
+"""
+Angle -> sector resolution for the Chakram X controller.
+Kept free of pygame so the lookup table can be checked on its own.
+"""
+
+# Table entry for a degree slot that contains a sector bound; those angles are scanned exactly
+NEEDS_SCAN = object()
+
+def scan_sector(sectors, angle):
+    """
+    Return the first sector (in config order) whose inclusive range contains the angle.
+    Returns None if the configured sectors do not cover the angle.
+    """
+    for sector_name, sector_range in sectors.items():
+        start = sector_range["start"]
+        end = sector_range["end"]
+        
+        # Handle sector that wraps around 0°
+        if start > end:
+            if angle >= start or angle <= end:
+                return sector_name
+        elif start <= angle <= end:
+            return sector_name
+    
+    return None
+
+def build_sector_lut(sectors):
+    """
+    Build a 361-entry angle -> sector name lookup table (one entry per whole degree).
+    Scan membership only changes at a sector bound, so a slot with no bound in
+    [degree, degree + 1) resolves the same for every angle in it and stores the scan
+    result. Slots that contain a bound (including fractional bounds from the config
+    editor) and slot 360 store NEEDS_SCAN and are resolved by scan_sector.
+    """
+    boundary_slots = {360}
+    for sector_range in sectors.values():
+        for bound in (sector_range["start"], sector_range["end"]):
+            if 0 <= bound <= 360:
+                boundary_slots.add(int(bound))
+    
+    lut = []
+    for degree in range(361):
+        if degree in boundary_slots:
+            lut.append(NEEDS_SCAN)
+        else:
+            lut.append(scan_sector(sectors, degree + 0.5))
+    return tuple(lut)
+
+def lookup_sector(lut, sectors, angle):
+    """Resolve an angle in [0°, 360°] to a sector name; same result as scan_sector."""
+    sector = lut[int(angle)]
+    if sector is NEEDS_SCAN:
+        return scan_sector(sectors, angle)
+    return sector
@@ -52,8 +52,9 @@ class Visualizer:
         self.draw_pressed_keys(controller_info["pressed_keys"])
         
         # Draw movement trail if available
+        # (snapshot the live history once, since the controller thread keeps appending to it)
         if "movement_trail" in controller_info and controller_info["movement_trail"]:
-            self.draw_movement_trail(controller_info["movement_trail"])
+            self.draw_movement_trail(list(controller_info["movement_trail"]))
         
         return self.surface
     
@@ -108,6 +108,31 @@ GetCursorPos = user32.GetCursorPos
 GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
 GetCursorPos.restype = wintypes.BOOL
 
+# Get async key state function (polled every controller tick, so bind the prototype once)
+GetAsyncKeyState = user32.GetAsyncKeyState
+GetAsyncKeyState.argtypes = [wintypes.INT]
+GetAsyncKeyState.restype = wintypes.SHORT
+
+# Timer resolution and thread priority (used by the controller thread to tighten its loop)
+THREAD_PRIORITY_TIME_CRITICAL = 15
+TIMERR_NOERROR = 0
+
+winmm = ctypes.WinDLL('winmm')
+timeBeginPeriod = winmm.timeBeginPeriod
+timeBeginPeriod.argtypes = [wintypes.UINT]
+timeBeginPeriod.restype = wintypes.UINT
+timeEndPeriod = winmm.timeEndPeriod
+timeEndPeriod.argtypes = [wintypes.UINT]
+timeEndPeriod.restype = wintypes.UINT
+
+kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+GetCurrentThread = kernel32.GetCurrentThread
+GetCurrentThread.argtypes = []
+GetCurrentThread.restype = wintypes.HANDLE
+SetThreadPriority = kernel32.SetThreadPriority
+SetThreadPriority.argtypes = [wintypes.HANDLE, wintypes.INT]
+SetThreadPriority.restype = wintypes.BOOL
+
 # Initialize Interception devices
 keyboard = None
 mouse = None
@@ -214,14 +239,27 @@ def create_mouse_move_input(dx, dy, absolute=False):
         )
     )
 
+# VK_CODES and the mouse buttons are fixed, so every key/button event is built once at import;
+# the send functions below just pass (or copy) a ready INPUT structure to SendInput
+_KEY_DOWN_INPUTS = {key: create_key_input(key, False) for key in VK_CODES}
+_KEY_UP_INPUTS = {key: create_key_input(key, True) for key in VK_CODES}
+_MOUSE_DOWN_INPUTS = {button: create_mouse_input(button, True) for button in ('left', 'right', 'middle')}
+_MOUSE_UP_INPUTS = {button: create_mouse_input(button, False) for button in ('left', 'right', 'middle')}
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+# Fixed event sequences, keyed by their tuple of (key, is_up) events; the sector change sequences only
+# involve a few key combinations, so each INPUT array is built on first use and reused after that
+_SEQUENCE_INPUTS = {}
+
 def key_down_windows_api(key):
     """Send a key down event using the Windows API."""
     try:
-        input_struct = create_key_input(key, False)
-        if not input_struct:
+        input_struct = _KEY_DOWN_INPUTS.get(key)
+        if input_struct is None:
+            print(f"Error: Key '{key}' not found in VK_CODES")
             return False
         
-        result = SendInput(1, ctypes.byref(input_struct), ctypes.sizeof(INPUT))
+        result = SendInput(1, ctypes.byref(input_struct), _INPUT_SIZE)
         
         if result != 1:
             error = ctypes.get_last_error()
@@ -236,11 +274,12 @@ def key_down_windows_api(key):
 def key_up_windows_api(key):
     """Send a key up event using the Windows API."""
     try:
-        input_struct = create_key_input(key, True)
-        if not input_struct:
+        input_struct = _KEY_UP_INPUTS.get(key)
+        if input_struct is None:
+            print(f"Error: Key '{key}' not found in VK_CODES")
             return False
         
-        result = SendInput(1, ctypes.byref(input_struct), ctypes.sizeof(INPUT))
+        result = SendInput(1, ctypes.byref(input_struct), _INPUT_SIZE)
         
         if result != 1:
             error = ctypes.get_last_error()
@@ -252,14 +291,54 @@ def key_up_windows_api(key):
         print(f"Error sending key up event: {e}")
         return False
 
+def batch_key_up_windows_api(keys, middle_mouse=False):
+    """
+    Send key up events for several keys, and optionally a middle mouse up event,
+    in a single SendInput call (Windows API).
+    """
+    try:
+        expected = len(keys) + (1 if middle_mouse else 0)
+        inputs = (INPUT * expected)()
+        count = 0
+        
+        # Copy the prebuilt up events into the contiguous array
+        for key in keys:
+            input_struct = _KEY_UP_INPUTS.get(key)
+            if input_struct is None:
+                print(f"Error: Key '{key}' not found in VK_CODES")
+                continue
+            
+            inputs[count] = input_struct
+            count += 1
+        
+        if middle_mouse:
+            inputs[count] = _MOUSE_UP_INPUTS['middle']
+            count += 1
+        
+        if count == 0:
+            return False
+        
+        result = SendInput(count, inputs, _INPUT_SIZE)
+        
+        if result != count:
+            error = ctypes.get_last_error()
+            print(f"Error sending batched key up events: {error}")
+            return False
+        
+        return count == expected
+    except Exception as e:
+        print(f"Error sending batched key up events: {e}")
+        return False
+
 def mouse_button_down_windows_api(button):
     """Send a mouse button down event using Windows API."""
     try:
-        input_struct = create_mouse_input(button, True)
-        if not input_struct:
+        input_struct = _MOUSE_DOWN_INPUTS.get(button)
+        if input_struct is None:
+            print(f"Error: Unknown mouse button '{button}'")
             return False
         
-        result = SendInput(1, ctypes.byref(input_struct), ctypes.sizeof(INPUT))
+        result = SendInput(1, ctypes.byref(input_struct), _INPUT_SIZE)
         
         if result != 1:
             error = ctypes.get_last_error()
@@ -298,6 +377,29 @@ def get_cursor_position():
     
     return (point.x, point.y)
 
+def begin_timer_resolution(period_ms=1):
+    """
+    Request a finer system timer resolution so time.sleep() wakes up on time
+    (the Windows default tick is ~15.6ms). Must be paired with end_timer_resolution().
+    """
+    return timeBeginPeriod(period_ms) == TIMERR_NOERROR
+
+def end_timer_resolution(period_ms=1):
+    """Release a timer resolution requested with begin_timer_resolution()."""
+    return timeEndPeriod(period_ms) == TIMERR_NOERROR
+
+def raise_thread_priority():
+    """Run the calling thread at time-critical priority."""
+    if not SetThreadPriority(GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL):
+        error = ctypes.get_last_error()
+        print(f"Error raising thread priority: {error}")
+        return False
+    return True
+
+def get_vk_code(key):
+    """Return the virtual-key code for a key name, or None if it is not in VK_CODES."""
+    return VK_CODES.get(key)
+
 def is_key_pressed(key):
     """Check if a key is currently pressed."""
     if not INTERCEPTION_AVAILABLE:
@@ -307,11 +409,6 @@ def is_key_pressed(key):
                 print(f"Error: Key '{key}' not found in VK_CODES")
                 return False
             
-            # Import GetAsyncKeyState function
-            GetAsyncKeyState = user32.GetAsyncKeyState
-            GetAsyncKeyState.argtypes = [wintypes.INT]
-            GetAsyncKeyState.restype = wintypes.SHORT
-            
             # Check if key is pressed (highest bit is set)
             key_state = GetAsyncKeyState(VK_CODES[key])
             return (key_state & 0x8000) != 0
@@ -327,11 +424,6 @@ def is_key_pressed(key):
                 print(f"Error: Key '{key}' not found in VK_CODES")
                 return False
             
-            # Import GetAsyncKeyState function
-            GetAsyncKeyState = user32.GetAsyncKeyState
-            GetAsyncKeyState.argtypes = [wintypes.INT]
-            GetAsyncKeyState.restype = wintypes.SHORT
-            
             # Check if key is pressed (highest bit is set)
             key_state = GetAsyncKeyState(VK_CODES[key])
             return (key_state & 0x8000) != 0
@@ -342,11 +434,12 @@ def is_key_pressed(key):
 def mouse_button_up_windows_api(button):
     """Send a mouse button up event using Windows API."""
     try:
-        input_struct = create_mouse_input(button, False)
-        if not input_struct:
+        input_struct = _MOUSE_UP_INPUTS.get(button)
+        if input_struct is None:
+            print(f"Error: Unknown mouse button '{button}'")
             return False
         
-        result = SendInput(1, ctypes.byref(input_struct), ctypes.sizeof(INPUT))
+        result = SendInput(1, ctypes.byref(input_struct), _INPUT_SIZE)
         
         if result != 1:
             error = ctypes.get_last_error()
@@ -399,6 +492,36 @@ def key_up(key):
         print("Falling back to Windows API...")
         return key_up_windows_api(key)
 
+def batch_key_up(keys, middle_mouse=False):
+    """
+    Send key up events for several keys at once, optionally releasing the middle mouse
+    button too, using Interception or Windows API fallback.
+    With the Windows API all releases go out in a single SendInput call.
+    """
+    if not keys and not middle_mouse:
+        return True
+    
+    if not INTERCEPTION_AVAILABLE:
+        return batch_key_up_windows_api(keys, middle_mouse)
+    
+    global keyboard
+    
+    if not keyboard:
+        if not initialize():
+            return batch_key_up_windows_api(keys, middle_mouse)
+    
+    try:
+        # Interception has no batched send, so release the keys back to back
+        for key in keys:
+            interception.key_up(key)
+        if middle_mouse:
+            interception.mouse_up('middle')
+        return True
+    except Exception as e:
+        print(f"Error sending batched key up events with Interception: {e}")
+        print("Falling back to Windows API...")
+        return batch_key_up_windows_api(keys, middle_mouse)
+
 def press_key(key):
     """Press and release a key as a single atomic operation."""
     if not key_down(key):
@@ -660,7 +783,124 @@ def send_key_sequence(keys, delay=0.01):
             
             return True
 
-def send_sector_change(cancel_key, old_attack_key, new_attack_key, release_delay=0.0):
+def _send_input_sequence_windows_api(events):
+    """
+    Send a fixed sequence of (key, is_up) events in a single SendInput call (Windows API).
+    "middle_mouse" stands for the middle mouse button.
+    """
+    try:
+        inputs = _SEQUENCE_INPUTS.get(events)
+        
+        if inputs is None:
+            input_structs = []
+            for key, is_up in events:
+                if key == "middle_mouse":
+                    input_struct = (_MOUSE_UP_INPUTS if is_up else _MOUSE_DOWN_INPUTS)['middle']
+                else:
+                    input_struct = (_KEY_UP_INPUTS if is_up else _KEY_DOWN_INPUTS).get(key)
+                
+                if input_struct is None:
+                    print(f"Error: Key '{key}' not found in VK_CODES")
+                    return False
+                
+                input_structs.append(input_struct)
+            
+            inputs = (INPUT * len(input_structs))(*input_structs)
+            _SEQUENCE_INPUTS[events] = inputs
+        
+        count = len(inputs)
+        result = SendInput(count, inputs, _INPUT_SIZE)
+        
+        if result != count:
+            error = ctypes.get_last_error()
+            print(f"Error sending input sequence: {error}")
+            return False
+        
+        return True
+    except Exception as e:
+        print(f"Error sending input sequence: {e}")
+        return False
+
+def _send_input_sequence_interception(events):
+    """Send a sequence of (key, is_up) events back to back with Interception."""
+    for key, is_up in events:
+        if key == "middle_mouse":
+            if is_up:
+                interception.mouse_up('middle')
+            else:
+                interception.mouse_down('middle')
+        elif is_up:
+            interception.key_up(key)
+        else:
+            interception.key_down(key)
+
+def _send_input_sequence(events):
+    """
+    Send a fixed sequence of (key, is_up) events using Interception or Windows API fallback.
+    With the Windows API all events go out in a single SendInput call.
+    """
+    if not INTERCEPTION_AVAILABLE:
+        return _send_input_sequence_windows_api(events)
+    
+    global keyboard, mouse
+    
+    if not keyboard or not mouse:
+        if not initialize():
+            return _send_input_sequence_windows_api(events)
+    
+    try:
+        _send_input_sequence_interception(events)
+        return True
+    except Exception as e:
+        print(f"Error sending input sequence with Interception: {e}")
+        print("Falling back to Windows API...")
+        return _send_input_sequence_windows_api(events)
+
+def begin_sector_change(cancel_key, old_attack_key):
+    """
+    First half of a sector change: press the cancel key and release the old attack key.
+    The caller holds the cancel key for as long as the game needs to register it, then
+    calls finish_sector_change().
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return _send_input_sequence(((cancel_key, False), (old_attack_key, True)))
+
+def finish_sector_change(cancel_key, new_attack_key):
+    """
+    Second half of a sector change: release the cancel key and press the new attack key.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return _send_input_sequence(((cancel_key, True), (new_attack_key, False)))
+
+def send_sector_change_windows_api(cancel_key, old_attack_key, new_attack_key, release_delay=0.01):
+    """
+    Send the sector change sequence (cancel down, old attack up, cancel up, new attack down)
+    using the Windows API.
+    The sequence is split around the release delay so the cancel key is actually held;
+    with a delay of 0 all four events go out in a single SendInput call.
+    """
+    if release_delay <= 0:
+        return _send_input_sequence_windows_api(((cancel_key, False), (old_attack_key, True),
+                                                 (cancel_key, True), (new_attack_key, False)))
+    
+    # Split into the cancel press, both releases and the new attack press
+    groups = (((cancel_key, False),),
+              ((old_attack_key, True), (cancel_key, True)),
+              ((new_attack_key, False),))
+    for index, events in enumerate(groups):
+        if index:
+            time.sleep(release_delay)
+        
+        if not _send_input_sequence_windows_api(events):
+            return False
+    
+    return True
+
+def send_sector_change(cancel_key, old_attack_key, new_attack_key, release_delay=0.01):
     """
     Send a precise sector change sequence as a single atomic operation for maximum speed.
     
@@ -668,99 +908,54 @@ def send_sector_change(cancel_key, old_attack_key, new_attack_key, release_delay
         cancel_key (str): The cancel key or "middle_mouse" for middle mouse button
         old_attack_key (str): The old attack key
         new_attack_key (str): The new attack key
-        release_delay (float): Optional delay between key events (default: 0.0)
+        release_delay (float): How long the cancel key is held, and the pause before the new
+            attack press (default: 0.01; 0 sends everything at once, without a hold)
     
     Returns:
         bool: True if successful, False otherwise
     """
-    print(f"Executing sector change: {old_attack_key} -> {new_attack_key} with cancel: {cancel_key}")
-    
+    # No success output here: this runs on the controller's input thread, which already
+    # logs every sector change through its background log queue
     if not INTERCEPTION_AVAILABLE:
-        # Check if we're using the middle mouse button for cancel
-        if cancel_key == "middle_mouse":
-            # 1. Press middle mouse button
-            if not middle_mouse_down():
-                print("Failed to press middle mouse button")
-                return False
-            
-            # Small delay to ensure cancel is registered
-            time.sleep(0.01)
-            
-            # 2. Release old attack key
-            if not key_up(old_attack_key):
-                print(f"Failed to release old attack key: {old_attack_key}")
-                return False
-            
-            # 3. Release middle mouse button
-            if not middle_mouse_up():
-                print("Failed to release middle mouse button")
-                return False
-        else:
-            # 1. Press cancel key
-            if not key_down(cancel_key):
-                print(f"Failed to press cancel key: {cancel_key}")
-                return False
-            
-            # Small delay to ensure cancel is registered
-            time.sleep(0.01)
-            
-            # 2. Release old attack key
-            if not key_up(old_attack_key):
-                print(f"Failed to release old attack key: {old_attack_key}")
-                return False
-            
-            # 3. Release cancel key
-            if not key_up(cancel_key):
-                print(f"Failed to release cancel key: {cancel_key}")
-                return False
-        
-        # Small delay before pressing new attack key
-        time.sleep(0.01)
-        
-        # 4. Press new attack key
-        if not key_down(new_attack_key):
-            print(f"Failed to press new attack key: {new_attack_key}")
-            return False
-        
-        print(f"Sector change completed: {old_attack_key} -> {new_attack_key}")
-        return True
+        return send_sector_change_windows_api(cancel_key, old_attack_key, new_attack_key, release_delay)
     else:
         global keyboard, mouse
         
         if not keyboard or not mouse:
             if not initialize():
                 # Fallback to Windows API implementation
-                return send_sector_change(cancel_key, old_attack_key, new_attack_key, release_delay)
+                return send_sector_change_windows_api(cancel_key, old_attack_key, new_attack_key, release_delay)
         
         try:
             # Check if we're using the middle mouse button for cancel
             if cancel_key == "middle_mouse":
                 # Use middle mouse button
-                print("Using middle mouse button for cancel")
                 interception.mouse_down('middle')
-                time.sleep(0.01)  # Small delay to ensure cancel is registered
+                if release_delay > 0:
+                    time.sleep(release_delay)  # Hold the cancel so it is registered
                 interception.key_up(old_attack_key)
                 interception.mouse_up('middle')
-                time.sleep(0.01)  # Small delay before pressing new attack key
+                if release_delay > 0:
+                    time.sleep(release_delay)  # Small delay before pressing new attack key
                 interception.key_down(new_attack_key)
             else:
                 # Use keyboard key for cancel
-                print(f"Using keyboard key for cancel: {cancel_key}")
                 interception.key_down(cancel_key)
-                time.sleep(0.01)  # Small delay to ensure cancel is registered
+                if release_delay > 0:
+                    time.sleep(release_delay)  # Hold the cancel so it is registered
                 interception.key_up(old_attack_key)
                 interception.key_up(cancel_key)
-                time.sleep(0.01)  # Small delay before pressing new attack key
+                if release_delay > 0:
+                    time.sleep(release_delay)  # Small delay before pressing new attack key
                 interception.key_down(new_attack_key)
             
-            print(f"Sector change completed with Interception: {old_attack_key} -> {new_attack_key}")
             return True
         except Exception as e:
             print(f"Error sending sector change with Interception: {e}")
             print("Falling back to Windows API...")
             
             # Fallback to Windows API implementation
-            return send_sector_change(cancel_key, old_attack_key, new_attack_key, release_delay)
+            return send_sector_change_windows_api(cancel_key, old_attack_key, new_attack_key, release_delay)
 
 # Initialize the Interception context when the module is imported
 initialize()
@@ -0,0 +1,45 @@
+"""
+Test script to check that the sector lookup table matches a linear scan over the sectors,
+at and just beside every sector bound.
+"""
+
+from src.config import SECTORS
+from src.sectors import build_sector_lut, lookup_sector, scan_sector
+
+# Bounds as the Tk config editor can save them (float sliders)
+FRACTIONAL_SECTORS = {
+    "overhead": {"start": 225.5, "end": 314.25},
+    "right": {"start": 314.25, "end": 45.0},
+    "thrust": {"start": 45.0, "end": 134.75},
+    "left": {"start": 134.75, "end": 225.5},
+}
+
+def check(sectors):
+    lut = build_sector_lut(sectors)
+    angles = [0.0, 359.999, 360.0]
+    for sector_range in sectors.values():
+        for bound in (sector_range["start"], sector_range["end"]):
+            angles.extend((bound - 0.001, bound, bound + 0.001, bound - 0.5, bound + 0.5))
+    angles.extend(degree + 0.25 for degree in range(360))
+    
+    failures = 0
+    for angle in angles:
+        if not 0.0 <= angle <= 360.0:
+            continue
+        expected = scan_sector(sectors, angle)
+        actual = lookup_sector(lut, sectors, angle)
+        if actual != expected:
+            print(f"  MISMATCH at {angle}: table={actual} scan={expected}")
+            failures += 1
+    return failures
+
+print("Checking configured sectors:")
+failures = check(SECTORS)
+print("Checking fractional sectors:")
+failures += check(FRACTIONAL_SECTORS)
+
+# Exactly on a shared bound the first sector in config order wins
+assert lookup_sector(build_sector_lut(FRACTIONAL_SECTORS), FRACTIONAL_SECTORS, 45.0) == "right"
+
+assert failures == 0, f"{failures} mismatches"
+print("All sector lookups match the scan.")